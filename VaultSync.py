@@ -6,20 +6,122 @@ License: MIT
 """
 
 import sys
-import argparse
+from typing import Optional, Tuple
 from pathlib import Path
 
 
-current_dir = Path(__file__).parent.absolute()
-src_dir = current_dir / "src"
-sys.path.insert(0, str(src_dir))
+VERSION = "2.1.0"
 
-from service_handler import ServiceHandler
-from config.config_manager import ConfigSetup
+_CONTROL_SPECS = [
 
+    ('--background',      'background',      'Run VaultSync as background process (no console)'),
+    ('--run',             'run',             'Run VaultSync normally (showing console output)'),
+    ('--stop',            'stop',            'Stop VaultSync background process'),
+    ('--status',          'status',          'Check VaultSync process status and if auto-run is enabled'),
+    ('--config',          'config',          'Show VaultSync configuration'),
+    ('--check',           'check',           'Check configuration and requirements'),
+    ('--enable-autorun',  'enable_autorun',  'Enable VaultSync to run automatically on Windows boot'),
+    ('--disable-autorun', 'disable_autorun', 'Disable VaultSync auto-run on Windows boot')
+]
 
-def main():
-        
+_SETUP_SPECS = [
+
+    ('--vault-path',        'vault_path',        str, 'PATH',  'Set vault path'),
+    ('--sync-mode',         'sync_mode',         str, 'MODE',  'Set sync mode: on_close or interval'),
+    ('--interval-time',     'interval_time',     int, 'MIN',   '  Set interval time in minutes (only for interval mode)'),
+    ('--backup',            'backup',            str, '',      'Enable or disable backup functionality: enable or disable'),
+    ('--backup-dir',        'backup_dir',        str, 'PATH',  'Set backup directory path'),
+    ('--max-backups',       'max_backups',       int, 'NUM',   'Set maximum number of backups to keep'),
+    ('--notification',      'notification',      str, '',      'Enable or disable desktop notifications: enable or disable'),
+    ('--git-username',      'git_username',      str, '',      'Set Git username'),
+    ('--git-email',         'git_email',         str, 'EMAIL', 'Set Git email address'),
+    ('--github-token',      'github_token',      str, 'TOKEN', 'Set GitHub personal access token'),
+    ('--github-username',   'github_username',   str, '',      'Set GitHub username'),
+    ('--github-repository', 'github_repository', str, '',      'Set GitHub repository name')
+]
+
+# Flag table for the fast argv scan: option -> (dest, type)
+_FLAGS = {flag: (dest, bool) for flag, dest, _ in _CONTROL_SPECS}
+_FLAGS.update({flag: (dest, typ) for flag, dest, typ, _, _ in _SETUP_SPECS})
+
+
+class _Args:
+
+    # Parsed command line. Slots keep the per-flag reads in main() off the
+    # instance dict and turn a mistyped attribute name into an error; used
+    # by both the fast scan and the argparse fallback
+    __slots__ = tuple(dest for dest, _ in _FLAGS.values())
+
+    def __init__( self ):
+
+        for dest, kind in _FLAGS.values():
+            setattr(self, dest, False if kind is bool else None)
+
+
+def _parse_fast( argv: list ) -> Optional[Tuple[_Args, bool]]:
+
+    # Single pass over argv for the fixed flag set, returning the parsed args
+    # and whether any configuration flag was given. Returns None for anything
+    # it does not fully understand (help, abbreviations, bad values) so that
+    # argparse can take over and report it the usual way
+
+    args = _Args()
+
+    setup_flag_seen = False
+
+    i = 0
+    while i < len(argv):
+
+        token = argv[i]
+        value = None
+
+        if token == '--version':
+            print(f"{Path(sys.argv[0]).name} {VERSION}")
+            sys.exit(0)
+
+        if token.startswith('--') and '=' in token:
+            token, value = token.split('=', 1)
+
+        spec = _FLAGS.get(token)
+        if spec is None:
+            return None
+
+        dest, kind = spec
+
+        if kind is bool:
+
+            if value is not None:
+                return None
+
+            setattr(args, dest, True)
+
+        else:
+
+            if value is None:
+
+                i += 1
+                if i >= len(argv) or argv[i].startswith('-'):
+                    return None
+
+                value = argv[i]
+
+            if kind is int:
+                try:
+                    value = int(value)
+                except ValueError:
+                    return None
+
+            setattr(args, dest, value)
+            setup_flag_seen = setup_flag_seen or bool(value)
+
+        i += 1
+
+    return args, setup_flag_seen
+
+
+def _build_parser():
+
+    import argparse
 
     parser = argparse.ArgumentParser(
         
@@ -29,82 +131,54 @@ def main():
         """
         
     )
-    parser.add_argument('--version', action='version', version='%(prog)s 2.1.0')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {VERSION}')
 
     # Control commands group
     control_group = parser.add_argument_group('Control Commands')
-    control_group.add_argument('--background', action='store_true',
-                       help='Run VaultSync as background process (no console)')
-    control_group.add_argument('--run', action='store_true',
-                       help='Run VaultSync normally (showing console output)')
-    control_group.add_argument('--stop', action='store_true',
-                       help='Stop VaultSync background process')
-    control_group.add_argument('--status', action='store_true',
-                       help='Check VaultSync process status and if auto-run is enabled')
-    control_group.add_argument('--config', action='store_true',
-                       help='Show VaultSync configuration')
-    control_group.add_argument('--check', action='store_true',
-                       help='Check configuration and requirements')
-    control_group.add_argument('--enable-autorun', action='store_true',
-                       help='Enable VaultSync to run automatically on Windows boot')
-    control_group.add_argument('--disable-autorun', action='store_true',
-                       help='Disable VaultSync auto-run on Windows boot')
+
+    for flag, dest, help_text in _CONTROL_SPECS:
+        control_group.add_argument(flag, dest=dest, action='store_true', help=help_text)
 
     # Configuration setup commands group
     setup_group = parser.add_argument_group('Configuration Commands', 
                                            'Argument syntax: --argument <Value>')
     
-    
-    setup_group.add_argument('--vault-path', metavar='PATH',
-                       help='Set vault path')
-    setup_group.add_argument('--sync-mode', metavar='MODE',
-                       help='Set sync mode: on_close or interval')
-    setup_group.add_argument('--interval-time', type=int, metavar='MIN',
-                       help='  Set interval time in minutes (only for interval mode)')
-    setup_group.add_argument('--backup', metavar='',
-                       help='Enable or disable backup functionality: enable or disable',)
-    setup_group.add_argument('--backup-dir', metavar='PATH',
-                       help='Set backup directory path')
-    setup_group.add_argument('--max-backups', type=int, metavar='NUM',
-                       help='Set maximum number of backups to keep')
-    setup_group.add_argument('--notification', metavar='',
-                       help='Enable or disable desktop notifications: enable or disable')
-    setup_group.add_argument('--git-username', metavar='',
-                       help='Set Git username')
-    setup_group.add_argument('--git-email', metavar='EMAIL',
-                       help='Set Git email address')
-    setup_group.add_argument('--github-token', metavar='TOKEN',
-                       help='Set GitHub personal access token')
-    setup_group.add_argument('--github-username', metavar='',
-                       help='Set GitHub username')
-    setup_group.add_argument('--github-repository', metavar='',
-                       help='Set GitHub repository name')
-
-    args = parser.parse_args()
-    
+    for flag, dest, typ, metavar, help_text in _SETUP_SPECS:
+        setup_group.add_argument(flag, dest=dest, type=typ, metavar=metavar, help=help_text)
+
+    return parser
+
+
+def main():
+
     if len(sys.argv) == 1:
-        parser.print_help()
+        _build_parser().print_help()
         return
+
+    # Heavy modules (yaml, psutil, the src/ tree) are imported only once an
+    # action has been selected, so --help/--version stay cheap
+    parsed = _parse_fast(sys.argv[1:])
+
+    if parsed is not None:
+        args, has_setup_args = parsed
+
+    else:
+        args = _build_parser().parse_args(namespace=_Args())
+        has_setup_args = any(getattr(args, dest) for _, dest, _, _, _ in _SETUP_SPECS)
     
     try:
 
-        handler = ServiceHandler()
-        config_setup = ConfigSetup()
-        
-        setup_args = [
-            
-            args.vault_path, args.sync_mode, args.interval_time,
-            args.backup, args.backup_dir, args.max_backups,
-            args.notification, args.git_username, args.git_email,
-            args.github_token, args.github_username, args.github_repository
+        if has_setup_args:
             
-        ]
-        
-        if any(setup_args):
-            
-            config_setup.handle_setup(args)
+            from src.config.config_manager import ConfigSetup
+
+            ConfigSetup().handle_setup(args)
             return
         
+        from src.service_handler import ServiceHandler
+
+        handler = ServiceHandler()
+
         if args.background:
             handler.run_background()
             
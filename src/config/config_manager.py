@@ -1,11 +1,292 @@
 #!/usr/bin/env python3
 
 import os
+import re
+import copy
+import hashlib
+import logging
+import shutil
 import yaml
+import pickle
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from functools import cached_property, lru_cache
+from contextlib import contextmanager
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# VaultSync directory (src/config/ -> src/ -> root), resolved once per process
+_BASE_DIR = Path(__file__).parent.parent.parent.absolute()
+
+# One KEY=value line of a .env file, in the python-dotenv syntax: optional
+# "export", then a single-quoted, double-quoted or bare value, then an
+# optional comment. Comment lines never match the key group
+_ENV_RE = re.compile(
+    r'[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:\'((?:\\\'|[^\'])*)\'|"((?:\\"|[^"])*)"|([^\r\n]*))'
+    r'[ \t]*(?:#[^\r\n]*)?'
+)
+
+# A bare value ends at the first '#' preceded by whitespace
+_ENV_BARE_COMMENT_RE = re.compile(r'\s+#.*')
+
+# Escapes decoded inside quoted values, as python-dotenv does
+_ENV_SINGLE_ESCAPE_RE = re.compile(r"\\([\\'])")
+_ENV_DOUBLE_ESCAPE_RE = re.compile(r'\\([\\\'"abfnrtv])')
+_ENV_DOUBLE_ESCAPES = {
+    '\\': '\\', "'": "'", '"': '"', 'a': '\a', 'b': '\b',
+    'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v'
+}
+
+# .env values containing any of these are written quoted
+_ENV_QUOTE_CHARS = frozenset(' \t#"\'\n\r')
+
+# Length of the config.yaml content hash stored at the start of its .cache
+_YAML_DIGEST_SIZE = 16
+
+# Shared with utils.logger.Logger, so messages land in VaultSync.log when the
+# engine is running and on stderr for CLI commands
+_log = logging.getLogger("VaultSync")
+
+_TRUTHY = frozenset({'enable', 'enabled', 'true', '1'})
+_FALSY = frozenset({'disable', 'disabled', 'false', '0'})
+
+# Template used when config.yaml does not exist yet
+_DEFAULT_CONFIG_TEMPLATE = {
+    
+    'vault': {
+        'path': '',
+        'branch': 'main'
+    },
+    
+    'sync': {
+        'mode': 'on_close',
+        'interval_minutes': 2,
+        'process_name': 'Obsidian.exe'
+    },
+    
+    'backup': {
+        'enabled': True,
+        'directory': '',
+        'max_backups': 2
+    },
+    
+    'logging': {
+        'file': 'VaultSync.log',
+        'level': 'INFO'
+    },
+    
+    'notification': {
+        'enabled': True,
+        'timeout': 3,
+        'icon_path': None
+    },
+    
+    'git': {
+        'timeout': 120,
+        'fsck_interval': 3600,
+        'user_name': '',
+        'user_email': '',
+        'gitignore': {
+            'obsidian': [],
+            'system': [
+                '.DS_Store',
+                'Thumbs.db',
+                '*.tmp',
+                '*.lock',
+                '*.swp',
+                '*~'
+            ],
+            'directories': [
+                '.trash/',
+                '__pycache__/',
+                '.vscode/',
+                '.idea/'
+            ],
+            'custom': []
+        }
+    }
+}
+
+# Pre-serialised copy of the template, so each fallback is a single
+# pickle.loads rather than a recursive deepcopy of the nested dict
+_DEFAULT_CONFIG_PICKLE = pickle.dumps(_DEFAULT_CONFIG_TEMPLATE)
+
+
+def _parse_bool_flag( value: str ) -> Optional[bool]:
+
+    # enable/disable style CLI value -> True/False, None if unrecognised
+
+    value = value.lower()
+
+    if value in _TRUTHY:
+        return True
+
+    if value in _FALSY:
+        return False
+
+    return None
+
+
+def _parse_env_line( line: str ) -> Optional[Tuple[str, str]]:
+
+    # (key, value) of one .env line, None for blank, comment and unreadable lines
+
+    m = _ENV_RE.fullmatch(line)
+    if m is None:
+        return None
+
+    key, single, double, bare = m.groups()
+
+    if single is not None:
+        value = _ENV_SINGLE_ESCAPE_RE.sub(r'\1', single)
+
+    elif double is not None:
+        value = _ENV_DOUBLE_ESCAPE_RE.sub(lambda e: _ENV_DOUBLE_ESCAPES[e.group(1)], double)
+
+    else:
+        value = _ENV_BARE_COMMENT_RE.sub('', bare).rstrip()
+
+    return key, value
+
+
+def _parse_env_file( path: Path ) -> Dict[str, str]:
+
+    env_data = {}
+
+    for lineno, line in enumerate(path.read_text(encoding='utf-8').splitlines(), 1):
+
+        entry = _parse_env_line(line)
+
+        if entry is None:
+
+            # Only the line number: the value may be a token
+            stripped = line.strip()
+            if stripped and not stripped.startswith('#'):
+                _log.warning(f"[!] Skipping invalid line {lineno} in {path.name} (expected KEY=value)")
+
+            continue
+
+        env_data[entry[0]] = entry[1]
+
+    return env_data
+
+
+def _format_env_value( value: str ) -> str:
+
+    # Quote values that would otherwise read back differently: spaces, '#',
+    # quote characters and line breaks. Double quotes with the escapes
+    # _parse_env_file decodes
+
+    if not _ENV_QUOTE_CHARS.intersection(value):
+        return value
+
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"')
+                    .replace('\n', '\\n').replace('\r', '\\r'))
+
+    return f'"{escaped}"'
+
+
+@contextmanager
+def _open_atomic( path: Path, mode: str = 'w', **kwargs ):
+
+    # Write to a sibling temp file and swap it in, so readers never see a torn file.
+    # The temp file is created owner-only (.env holds the GitHub token) and
+    # takes over the existing file's mode before the swap
+
+    tmp_path = path.with_name(path.name + '.tmp')
+
+    try:
+        tmp_path.unlink(missing_ok=True)
+
+        with open(tmp_path, mode, opener=lambda p, flags: os.open(p, flags, 0o600), **kwargs) as f:
+            yield f
+
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+
+        os.replace(tmp_path, path)
+
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_atomic( path: Path, data: bytes ) -> None:
+
+    with _open_atomic(path, 'wb') as f:
+        f.write(data)
+
+
+def _load_yaml_file( path: Path ) -> Any:
+
+    # The parsed document is shared by every caller in the process while the
+    # file content is unchanged - copy it before mutating
+
+    return _parse_yaml_file(str(path), path.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _parse_yaml_file( path_str: str, raw: bytes ) -> Any:
+
+    # Parse a YAML file, reusing the pickled result of the previous parse
+    # (stored next to it as <name>.cache) when _read_yaml_cache accepts it
+
+    path = Path(path_str)
+    digest = hashlib.blake2b(raw, digest_size=_YAML_DIGEST_SIZE).digest()
+    cache_path = path.with_name(path.name + '.cache')
+
+    cached = _read_yaml_cache(path, cache_path, digest)
+    if cached is not None:
+        return cached[0]
+
+    # Raw bytes let the parser do the UTF-8 decoding itself
+    data = yaml.load(raw, Loader=_YamlLoader)
+
+    try:
+        # Recreated rather than overwritten, so a rejected cache does not
+        # pass its mode on to the new one
+        cache_path.unlink(missing_ok=True)
+        _write_atomic(cache_path, digest + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+    return data
+
+
+def _read_yaml_cache( path: Path, cache_path: Path, digest: bytes ) -> Optional[tuple]:
+
+    # (data,) from the cache file, or None when it must not be used.
+    # Unpickling runs code, so the file has to be ours and private: owned by
+    # the current user and not writable by anyone else. It must also be
+    # newer than the yaml and made from the same content, since a coarse
+    # mtime (FAT, SMB) can miss an edit on its own
+
+    try:
+
+        with open(cache_path, 'rb') as f:
+
+            st = os.fstat(f.fileno())
+
+            if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                return None
+
+            if st.st_mtime_ns < path.stat().st_mtime_ns:
+                return None
+
+            blob = f.read()
+
+        if blob[:_YAML_DIGEST_SIZE] != digest:
+            return None
+
+        return (pickle.loads(blob[_YAML_DIGEST_SIZE:]),)
+
+    except Exception:
+        return None
 
 
 @dataclass
@@ -46,6 +327,7 @@ class GitConfig:
     user_name: str
     user_email: str
     gitignore: Dict[str, list] 
+    fsck_interval: int = 3600
 
 
 class ConfigManager:
@@ -53,20 +335,72 @@ class ConfigManager:
         
     def __init__( self, config_path: str = "config.yaml", env_path: str = ".env" ):
         
-        current_dir = Path(__file__).parent.parent.parent.absolute()  # Go up to VaultSync directory
-        self.base_dir = current_dir
+        self.base_dir = _BASE_DIR
         
         self.config_path = self.base_dir / config_path
         self.env_path = self.base_dir / env_path
         
+        # config.yaml and .env are only read once a section or the remote
+        # URL is first accessed
+        self._config_loaded = False
+        
+        
+    @property
+    def vault( self ) -> VaultConfig:
+        
+        self._ensure_config()
+        return self._vault
+    
+    
+    @property
+    def sync( self ) -> SyncConfig:
+        
+        self._ensure_config()
+        return self._sync
+    
+    
+    @property
+    def backup( self ) -> BackupConfig:
+        
+        self._ensure_config()
+        return self._backup
+    
+    
+    @property
+    def notification( self ) -> NotificationConfig:
+        
+        self._ensure_config()
+        return self._notification
+    
+    
+    @property
+    def git( self ) -> GitConfig:
+        
+        self._ensure_config()
+        return self._git
+    
+    
+    @cached_property
+    def git_remote( self ) -> str:
+        
         self._load_environment()
-        self._load_config()
+        return self._build_git_remote()
+        
+        
+    def _ensure_config( self ) -> None:
+        
+        if not self._config_loaded:
+            self._load_config()
+            self._config_loaded = True
         
         
     def _load_environment( self ) -> None:
         
         if self.env_path.exists():
-            load_dotenv(self.env_path)
+            
+            # Variables already set in the environment take precedence
+            for key, value in _parse_env_file(self.env_path).items():
+                os.environ.setdefault(key, value)
         else:
             raise FileNotFoundError(f"Environment file not found: {self.env_path}")
         
@@ -80,14 +414,12 @@ class ConfigManager:
         
         try:
             
-            with self.config_path.open('r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_yaml_file(self.config_path)
             
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in config file: {e}")
         
         self._create_config_objects(config_data)
-        self._build_git_remote()
         
         
     def _create_config_objects( self, config_data: Dict[str, Any] ) -> None:
@@ -96,20 +428,20 @@ class ConfigManager:
                 
         try:
             
-            self.vault = VaultConfig(
+            self._vault = VaultConfig(
                 
                 path=Path(config_data['vault']['path']),
                 branch=config_data['vault']['branch']
             )
             
-            self.sync = SyncConfig(
+            self._sync = SyncConfig(
                 
                 mode=config_data['sync']['mode'],
                 interval_minutes=config_data['sync']['interval_minutes'],
                 process_name=config_data['sync']['process_name']
             )
             
-            self.backup = BackupConfig(
+            self._backup = BackupConfig(
                 
                 enabled=config_data['backup']['enabled'],
                 directory=Path(config_data['backup']['directory']) if config_data['backup']['directory'] else Path(),
@@ -117,19 +449,20 @@ class ConfigManager:
             )
             
             icon_path = config_data['notification']['icon_path']
-            self.notification = NotificationConfig(
+            self._notification = NotificationConfig(
                 
                 enabled=config_data['notification']['enabled'],
                 timeout=config_data['notification']['timeout'],
                 icon_path=Path(icon_path) if icon_path else None
             )
             
-            self.git = GitConfig(
+            self._git = GitConfig(
                 
                 timeout=config_data['git']['timeout'],
                 user_name=config_data['git']['user_name'],
                 user_email=config_data['git']['user_email'],
-                gitignore=config_data['git']['gitignore']  
+                gitignore=config_data['git']['gitignore'],
+                fsck_interval=config_data['git'].get('fsck_interval', 3600)
             )
             
         except KeyError as e:
@@ -139,7 +472,7 @@ class ConfigManager:
             raise ValueError(f"Error creating configuration objects: {e}")
         
         
-    def _build_git_remote( self ) -> None:
+    def _build_git_remote( self ) -> str:
                 
         github_token = os.getenv('GITHUB_TOKEN')
         github_username = os.getenv('GITHUB_USERNAME')
@@ -156,7 +489,7 @@ class ConfigManager:
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
         
-        self.git_remote = f"https://{github_token}@github.com/{github_username}/{github_repository}.git"
+        return f"https://{github_token}@github.com/{github_username}/{github_repository}.git"
     
     
     def validate( self ) -> None:
@@ -182,6 +515,9 @@ class ConfigManager:
             
         if self.git.timeout <= 0:
             raise ValueError("Git timeout must be positive")
+            
+        if self.git.fsck_interval < 0:
+            raise ValueError("Git fsck interval cannot be negative")
 
 
 class ConfigSetup:
@@ -189,8 +525,7 @@ class ConfigSetup:
     
     def __init__( self ):
         
-        current_dir = Path(__file__).parent.parent.parent.absolute()
-        self.base_dir = current_dir
+        self.base_dir = _BASE_DIR
         self.config_file = self.base_dir / "config.yaml"
         self.env_file = self.base_dir / ".env"
         
@@ -207,22 +542,29 @@ class ConfigSetup:
         config_data = self._load_existing_config()
         env_data = self._load_existing_env()
         
-        config_updated = False
+        vault = config_data['vault']
+        sync = config_data['sync']
+        backup = config_data['backup']
+        notification = config_data['notification']
+        git = config_data['git']
+        
+        # (section, key) of every config.yaml leaf that was changed
+        config_changes = []
         env_updated = False
         
         # Apply vault configuration
         if args.vault_path:
             
-            config_data['vault']['path'] = args.vault_path
-            config_updated = True
+            vault['path'] = args.vault_path
+            config_changes.append(('vault', 'path'))
             print(f"[+] Vault path set to: {args.vault_path}")
             
         # Apply sync configuration
         if args.sync_mode:
             
-            if args.sync_mode in ['on_close', 'interval']:
-                config_data['sync']['mode'] = args.sync_mode
-                config_updated = True
+            if args.sync_mode in ('on_close', 'interval'):
+                sync['mode'] = args.sync_mode
+                config_changes.append(('sync', 'mode'))
                 print(f"[+] Sync mode set to: {args.sync_mode}")
             else:
                 print(f"[x] Invalid sync mode: {args.sync_mode}. Use 'on_close' or 'interval'")
@@ -231,8 +573,8 @@ class ConfigSetup:
         if args.interval_time is not None:
             
             if args.interval_time > 0:
-                config_data['sync']['interval_minutes'] = args.interval_time
-                config_updated = True
+                sync['interval_minutes'] = args.interval_time
+                config_changes.append(('sync', 'interval_minutes'))
                 print(f"[+] Interval time set to: {args.interval_time} minutes")
             else:
                 print("[x] Interval time must be greater than 0")
@@ -241,14 +583,16 @@ class ConfigSetup:
         # Apply backup configuration
         if args.backup:
             
-            if args.backup.lower() in ['enable', 'enabled', 'true', '1']:
-                config_data['backup']['enabled'] = True
-                config_updated = True
+            enabled = _parse_bool_flag(args.backup)
+            
+            if enabled is True:
+                backup['enabled'] = True
+                config_changes.append(('backup', 'enabled'))
                 print("[+] Backup enabled")
                 
-            elif args.backup.lower() in ['disable', 'disabled', 'false', '0']:
-                config_data['backup']['enabled'] = False
-                config_updated = True
+            elif enabled is False:
+                backup['enabled'] = False
+                config_changes.append(('backup', 'enabled'))
                 print("[+] Backup disabled")
                 
             else:
@@ -259,17 +603,18 @@ class ConfigSetup:
             
             backup_path = Path(args.backup_dir)
 
-            backup_path.mkdir(parents=True, exist_ok=True)
+            if not backup_path.is_dir():
+                backup_path.mkdir(parents=True, exist_ok=True)
             
-            config_data['backup']['directory'] = str(backup_path)
-            config_updated = True
+            backup['directory'] = str(backup_path)
+            config_changes.append(('backup', 'directory'))
             print(f"[+] Backup directory set to: {backup_path}")
             
         if args.max_backups is not None:
             
             if args.max_backups > 0:
-                config_data['backup']['max_backups'] = args.max_backups
-                config_updated = True
+                backup['max_backups'] = args.max_backups
+                config_changes.append(('backup', 'max_backups'))
                 print(f"[+] Maximum backups set to: {args.max_backups}")
             else:
                 print("[x] Maximum backups must be greater than 0")
@@ -278,14 +623,16 @@ class ConfigSetup:
         # Apply notification configuration
         if args.notification:
             
-            if args.notification.lower() in ['enable', 'enabled', 'true', '1']:
-                config_data['notification']['enabled'] = True
-                config_updated = True
+            enabled = _parse_bool_flag(args.notification)
+            
+            if enabled is True:
+                notification['enabled'] = True
+                config_changes.append(('notification', 'enabled'))
                 print("[+] Notifications enabled")
                 
-            elif args.notification.lower() in ['disable', 'disabled', 'false', '0']:
-                config_data['notification']['enabled'] = False
-                config_updated = True
+            elif enabled is False:
+                notification['enabled'] = False
+                config_changes.append(('notification', 'enabled'))
                 print("[+] Notifications disabled")
                 
             else:
@@ -294,14 +641,14 @@ class ConfigSetup:
             
         if args.git_username:
             
-            config_data['git']['user_name'] = args.git_username
-            config_updated = True
+            git['user_name'] = args.git_username
+            config_changes.append(('git', 'user_name'))
             print(f"[+] Git username set to: {args.git_username}")
             
         if args.git_email:
             
-            config_data['git']['user_email'] = args.git_email
-            config_updated = True
+            git['user_email'] = args.git_email
+            config_changes.append(('git', 'user_email'))
             print(f"[+] Git email set to: {args.git_email}")
             
 
@@ -323,13 +670,13 @@ class ConfigSetup:
             env_updated = True
             print(f"[+] GitHub repository set to: {args.github_repository}")
             
-        if config_updated:
-            self._save_config(config_data)
+        if config_changes:
+            self._save_config(config_data, config_changes)
             
         if env_updated:
             self._save_env(env_data)
             
-        if not config_updated and not env_updated:
+        if not config_changes and not env_updated:
             print("[*] No configuration changes to apply")
             
             
@@ -340,66 +687,12 @@ class ConfigSetup:
         if self.config_file.exists():
             
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f)
+                return copy.deepcopy(_load_yaml_file(self.config_file))
             except Exception as e:
                 print(f"[!] Warning: Could not load existing config: {e}")
                 
         # Default configuration template
-        return {
-            
-            'vault': {
-                'path': '',
-                'branch': 'main'
-            },
-            
-            'sync': {
-                'mode': 'on_close',
-                'interval_minutes': 2,
-                'process_name': 'Obsidian.exe'
-            },
-            
-            'backup': {
-                'enabled': True,
-                'directory': '',
-                'max_backups': 2
-            },
-            
-            'logging': {
-                'file': 'VaultSync.log',
-                'level': 'INFO'
-            },
-            
-            'notification': {
-                'enabled': True,
-                'timeout': 3,
-                'icon_path': None
-            },
-            
-            'git': {
-                'timeout': 120,
-                'user_name': '',
-                'user_email': '',
-                'gitignore': {
-                    'obsidian': [],
-                    'system': [
-                        '.DS_Store',
-                        'Thumbs.db',
-                        '*.tmp',
-                        '*.lock',
-                        '*.swp',
-                        '*~'
-                    ],
-                    'directories': [
-                        '.trash/',
-                        '__pycache__/',
-                        '.vscode/',
-                        '.idea/'
-                    ],
-                    'custom': []
-                }
-            }
-        }
+        return pickle.loads(_DEFAULT_CONFIG_PICKLE)
         
         
     def _load_existing_env( self ) -> Dict[str, str]:
@@ -409,30 +702,30 @@ class ConfigSetup:
         if self.env_file.exists():
             
             try:
-                with open(self.env_file, 'r', encoding='utf-8') as f:
-                    
-                    for line in f:
-                        
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            
-                            key, value = line.split('=', 1)
-                            env_data[key.strip()] = value.strip()
+                env_data = _parse_env_file(self.env_file)
             except Exception as e:
                 print(f"[!] Warning: Could not load existing .env: {e}")
                         
         return env_data
     
     
-    def _save_config( self, config_data: Dict[str, Any] ) -> None:
+    def _save_config( self, config_data: Dict[str, Any], changes: Optional[list] = None ) -> None:
                 
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            # A single changed leaf is patched into the existing file, which
+            # also keeps the user's comments and layout; anything else is a
+            # full dump
+            if changes and len(changes) == 1 and self._patch_config_field(config_data, *changes[0]):
+                print(f"[+] Configuration saved to: {self.config_file}")
+                return
+            
+            with _open_atomic(self.config_file, 'w', encoding='utf-8') as f:
                 
                 yaml.dump(
                     
                     config_data, 
                     f, 
+                    Dumper=_YamlDumper,
                     default_flow_style=False, 
                     sort_keys=False, 
                     indent=2,
@@ -445,16 +738,84 @@ class ConfigSetup:
             print(f"[x] Error saving configuration: {e}")
         
         
+    def _patch_config_field( self, config_data: Dict[str, Any], section: str, key: str ) -> bool:
+        
+        # Rewrite "key: value" under a top-level section of config.yaml in
+        # place. Returns False whenever the file does not have the plain
+        # block layout written by _save_config, so the caller can dump it
+        
+        if not self.config_file.exists():
+            return False
+        
+        text = self.config_file.read_bytes().decode('utf-8')
+        
+        header = re.search(rf'(?m)^{re.escape(section)}:[ \t]*\r?$', text)
+        if header is None:
+            return False
+        
+        # Children of the section are the indented lines up to the next
+        # top-level key
+        section_end = re.compile(r'(?m)^[^\s#]').search(text, header.end())
+        body_end = section_end.start() if section_end else len(text)
+        
+        first_child = re.compile(r'(?m)^([ \t]+)[^\s#]').search(text, header.end(), body_end)
+        if first_child is None:
+            return False
+        
+        leaf = re.compile(rf'(?m)^{first_child.group(1)}{re.escape(key)}:[ \t]*([^\r\n]*)')
+        match = leaf.search(text, header.end(), body_end)
+        if match is None or not match.group(1) or '#' in match.group(1):
+            return False
+        
+        rendered = yaml.dump({key: config_data[section][key]}, Dumper=_YamlDumper,
+                             default_flow_style=False, allow_unicode=True, width=2 ** 16)
+        value = rendered[len(key) + 1:].strip()
+        if not value or '\n' in value:
+            return False
+        
+        new_text = text[:match.start(1)] + value + text[match.end(1):]
+        
+        # Never write something that would read back differently
+        if yaml.load(new_text, Loader=_YamlLoader) != config_data:
+            return False
+        
+        _write_atomic(self.config_file, new_text.encode('utf-8'))
+        return True
+        
+        
     def _save_env( self, env_data: Dict[str, str] ) -> None:
         
         
         try:
-            with open(self.env_file, 'w', encoding='utf-8') as f:
+            # Changed keys are patched into the existing file. Comments, and
+            # lines the parser could not read, are kept as they are instead
+            # of being dropped with the rewrite
+            if self.env_file.exists():
+                lines = self.env_file.read_text(encoding='utf-8').splitlines()
+            else:
+                lines = ["# Environment Variables - KEEP THIS FILE PRIVATE!"]
+            
+            missing = dict(env_data)
+            
+            for i, line in enumerate(lines):
                 
-                f.write("# Environment Variables - KEEP THIS FILE PRIVATE!\n")
+                entry = _parse_env_line(line)
+                if entry is None or entry[0] not in env_data:
+                    continue
                 
-                for key, value in env_data.items():
-                    f.write(f"{key}={value}\n")
+                key, value = entry
+                missing.pop(key, None)
+                
+                if value != env_data[key]:
+                    
+                    # Keep any indentation and "export" in front of the key
+                    prefix = line[:_ENV_RE.fullmatch(line).start(1)]
+                    lines[i] = f"{prefix}{key}={_format_env_value(env_data[key])}"
+            
+            lines.extend(f"{key}={_format_env_value(value)}" for key, value in missing.items())
+            
+            with _open_atomic(self.env_file, 'w', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
                     
             print(f"[+] Environment file saved to: {self.env_file}")
             
@@ -1,27 +1,103 @@
 #!/usr/bin/env python3
 
+import os
+import re
 import sys
+import time
+import shutil
 import subprocess
 import threading
-from datetime import datetime
+import traceback
+from collections import Counter
 from pathlib import Path
-from typing import Optional, List, Dict
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
-from config.config_manager import GitConfig
-from utils.logger import Logger
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from ..config.config_manager import GitConfig
+from ..utils.logger import Logger
+
+
+# Subcommands that write to the index, refs, config or working tree. These
+# are serialised through GitManager._command_lock; read-only commands
+# (rev-parse, rev-list, status, ls-remote, ...) may run concurrently
+_MUTATING_COMMANDS = frozenset({
+    'init', 'branch', 'config', 'remote', 'add', 'commit', 'stash',
+    'fetch', 'pull', 'push', 'rebase', 'reset', 'checkout', 'merge'
+})
+
+# Subcommands that may create commits and therefore need an author identity
+_COMMITTING_COMMANDS = frozenset({'commit', 'stash', 'pull', 'rebase', 'merge'})
+
+# Porcelain status byte -> change category reported in the logs. The
+# index (X) letter is looked up first, then the worktree (Y) letter
+_STATUS_MAP = {
+    ord('M'): 'modified',
+    ord('R'): 'modified',
+    ord('A'): 'added',
+    ord('C'): 'added',
+    ord('D'): 'deleted',
+    ord('?'): 'untracked'
+}
+
+# First byte of porcelain v2 entries that carry an XY status pair
+_XY_ENTRY_TYPES = frozenset(b'12u')
+
+# A full object id: SHA-1, or SHA-256 in repositories that use it
+_OID_RE = re.compile(rb'[0-9a-f]{40}(?:[0-9a-f]{24})?')
+
+# Known non-critical stderr output that should not be logged as a warning
+_GIT_WARNING_RE = re.compile('|'.join(re.escape(pattern) for pattern in [
+    
+    "lf will be replaced by crlf",
+    "crlf will be replaced by lf",
+    "warning: adding embedded git repository",
+    "branch 'main' set up to track",
+    "branch            main       -> fetch_head",
+    "[new branch]      main       -> origin/main",
+    "to https://github.com",
+    "main -> main",
+    "fast-forward"
+]), re.IGNORECASE)
+
+# .gitignore layout written by GitManager._create_gitignore
+_GITIGNORE_SECTIONS = (
+    ('obsidian', "# Obsidian workspace (user-specific)"),
+    ('system', "# System files"),
+    ('directories', "# Directories"),
+    ('custom', "# Custom patterns")
+)
+
+_GITIGNORE_HEADER = """# .gitignore generated by VaultSync
+# Edit patterns in config.yaml under git.gitignore section
+
+"""
+
+_GITIGNORE_FOOTER = """
+
+# End of VaultSync .gitignore
+"""
 
 
 class GitCommandResult:
 
-    # Result of git command execution
+    # Result of git command execution. stdout/stderr hold the raw bytes;
+    # the *_text properties decode them when a str is actually needed
 
-    def __init__( self, returncode: int, stdout: str, stderr: str, command: str ):
+    def __init__( self, returncode: int, stdout: bytes, stderr: bytes, command: str ):
         
         self.returncode = returncode
         self.stdout = stdout
         self.stderr = stderr
         self.command = command
         self.success = returncode == 0
+        
+    @property
+    def stdout_text( self ) -> str:
+        return self.stdout.decode('utf-8', errors='replace')
+        
+    @property
+    def stderr_text( self ) -> str:
+        return self.stderr.decode('utf-8', errors='replace')
 
 
 class GitManager:
@@ -31,6 +107,11 @@ class GitManager:
         
         self.config = config
         self.vault_path = vault_path
+        self._git_dir = os.path.join(str(vault_path), ".git")
+        
+        # git is looked up on PATH once; every spawn then uses the full path
+        self._git_exe = shutil.which("git") or "git"
+        self._identity_args = ("-c", f"user.name={config.user_name}", "-c", f"user.email={config.user_email}")
         self.remote_url = remote_url
         self.branch = branch
         self.logger = logger
@@ -38,6 +119,10 @@ class GitManager:
         self.startupinfo = None
         self.creation_flags = 0
         
+        # Descriptors are non-inheritable by default (PEP 446), so on POSIX
+        # the child's close-all-fds pass before exec is wasted work
+        self.close_fds = sys.platform == "win32"
+        
         if sys.platform == "win32":
             
             self.startupinfo = subprocess.STARTUPINFO()
@@ -47,135 +132,280 @@ class GitManager:
         
         self._command_lock = threading.Lock()
         
+        # Shared worker threads for git commands that can run side by side
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gitmgr")
+        
         self._git_available = None
+        self._is_repository = False
+        
+        # Parsed 'git status --porcelain=v2 --branch', see _collect_repo_state
+        self._state_cache = None
+        
+        # monotonic time of the last clean fsck
+        self._last_fsck = None
+        
+        # Remote branch commit as of the last pull that left us up to date
+        self._last_remote_sha = None
+        
+        # Remote branch commit already fetched by prefetch(), consumed by pull()
+        self._prefetched_sha = None
+        
+        # Long-lived 'git cat-file --batch-check' used by _resolve_ref
+        self._ref_process = None
+        self._ref_lock = threading.Lock()
+        
+        self._gitignore_cache = None
+        
+
+    def close( self ) -> None:
+
+        # Release the worker threads and the ref lookup process; pending
+        # remote operations are not waited for
+
+        self._executor.shutdown(wait=False)
+        
+        with self._ref_lock:
+            
+            if self._ref_process is not None:
+                
+                try:
+                    self._ref_process.stdin.close()
+                    self._ref_process.wait(timeout=5)
+                except Exception:
+                    self._ref_process.kill()
+                    
+                self._ref_process = None
         
 
     def _check_git_availability( self ) -> bool:
         
+        # A single 'git rev-parse --absolute-git-dir' in the vault shows both
+        # that git can be run and whether the vault is already a repository
+        # (see _is_repository), instead of 'git --version' plus a separate
+        # probe. Only git's "not a git repository" counts as a missing
+        # repository; any other failure (unreadable vault, dubious ownership,
+        # broken install) must not lead setup into 'git init'
         
         if self._git_available is not None:
             return self._git_available
             
         try:
             
-            result = self._run_command_sync(
-                
-                ["git", "--version"], 
-                description="Git availability check",
-                timeout=10
-            )
+            argv, cwd = self._spawn_args(["git", "rev-parse", "--absolute-git-dir"])
             
-            self._git_available = result.success
-            
-            if self._git_available:
-                self.logger.debug(f"[+] Git available: {result.stdout.strip()}")
-            else:
-                self.logger.error("[x] Git not found in system PATH")
+            result = subprocess.run(
                 
-            return self._git_available
+                argv,
+                cwd=cwd,
+                capture_output=True,
+                timeout=10,
+                # Untranslated messages, so the stderr check below holds
+                env={**os.environ, 'LC_ALL': 'C'},
+                startupinfo=self.startupinfo,
+                creationflags=self.creation_flags,
+                close_fds=self.close_fds
+            )
             
         except Exception as e:
             
-            self.logger.error(f"[x] Git availability check failed: {e}")
+            self.logger.error("[x] Git not found in system PATH")
+            self.logger.debug(f"[x] Git availability check failed: {e}")
             self._git_available = False
             return False
+            
+        if result.returncode != 0 and b'not a git repository' not in result.stderr:
+            
+            # Not cached: the vault may become readable on a later attempt
+            error = result.stderr.decode('utf-8', 'replace').strip()
+            self.logger.error(f"[x] Could not inspect the vault repository: {error}")
+            return False
+        
+        self._git_available = True
+        
+        # The vault may sit inside some other repository, so it also needs a
+        # .git of its own: a directory, or a gitfile for worktrees/submodules
+        self._is_repository = result.returncode == 0 and os.path.exists(self._git_dir)
+        
+        self.logger.debug(f"[+] Git available, repository present: {self._is_repository}")
+        return True
+
+
+    def _spawn_args( self, cmd: List[str] ) -> Tuple[List[str], Optional[Path]]:
+
+        # argv and cwd for a 'git ...' command list: the resolved executable
+        # replaces "git", and on POSIX the vault is passed with -C instead of
+        # cwd=, which together let CPython use posix_spawn instead of fork+exec
+
+        if sys.platform == "win32":
+            return [self._git_exe, *cmd[1:]], self.vault_path
+
+        return [self._git_exe, "-C", str(self.vault_path), *cmd[1:]], None
 
 
     def _run_command_sync( self, cmd: List[str], description: str = "Git command", timeout: Optional[int] = None ) -> GitCommandResult:
         
-        # Run a git command synchronously with locking
+        # Run a git command synchronously, locking only commands that modify the repository
         
         if timeout is None:
             timeout = self.config.timeout
             
         cmd_str = ' '.join(cmd)
+        mutating = len(cmd) > 1 and cmd[1] in _MUTATING_COMMANDS
+        lock = self._command_lock if mutating else nullcontext()
+        
+        # The configured identity is passed per command with -c, so it applies
+        # even before setup has written it to the repository config
+        if mutating and cmd[1] in _COMMITTING_COMMANDS:
+            cmd = [cmd[0], *self._identity_args, *cmd[1:]]
+        
+        argv, cwd = self._spawn_args(cmd)
         
         try:
             
-            with self._command_lock:
+            with lock:
                 
                 self.logger.debug(f"[>] Executing: {cmd_str}")
                 
                 result = subprocess.run(
                     
-                    cmd,
-                    cwd=self.vault_path,
+                    argv,
+                    cwd=cwd,
                     capture_output=True,
-                    text=True,
                     timeout=timeout,
                     startupinfo=self.startupinfo,
                     creationflags=self.creation_flags,
-                    encoding='utf-8',
-                    errors='replace'
+                    close_fds=self.close_fds
                 )
                 
                 git_result = GitCommandResult(result.returncode, result.stdout, result.stderr, cmd_str)
                 
                 if git_result.success:
                     
-                    if git_result.stdout.strip() and "nothing to commit" not in git_result.stdout.lower():
-                        self.logger.debug(f"[+] {description}: {git_result.stdout.strip()}")
+                    if git_result.stdout.strip() and b"nothing to commit" not in git_result.stdout.lower():
+                        self.logger.debug(f"[+] {description}: {git_result.stdout_text.strip()}")
                         
                 else:
                     
                     self.logger.error(f"[x] {description} failed (exit code {git_result.returncode})")
                     
                     if git_result.stderr.strip():
-                        self.logger.error(f"[x] Error: {git_result.stderr.strip()}")
+                        self.logger.error(f"[x] Error: {git_result.stderr_text.strip()}")
                 
                 # Handle common warnings (non-critical)
                 if git_result.stderr.strip():
-                    self._handle_git_warnings(git_result.stderr, description)
+                    self._handle_git_warnings(git_result.stderr_text, description)
                 
                 return git_result
             
         except subprocess.TimeoutExpired:
             
             self.logger.error(f"[x] {description} timed out after {timeout} seconds")
-            return GitCommandResult(124, "", f"Command timed out after {timeout}s", cmd_str)
+            return GitCommandResult(124, b"", f"Command timed out after {timeout}s".encode(), cmd_str)
         
         except Exception as e:
             
             self.logger.error(f"[x] {description} failed: {e}")
-            return GitCommandResult(1, "", str(e), cmd_str)
+            return GitCommandResult(1, b"", str(e).encode('utf-8', errors='replace'), cmd_str)
         
+        finally:
+            
+            if mutating:
+                self._state_cache = None
         
-    def _run_command_async( self, cmd: List[str], description: str = "Git command", timeout: Optional[int] = None ) -> GitCommandResult:
         
-        # Run a git command asynchronously using thread pool
+    def _run_command_streaming( self, cmd: List[str], line_handler: Callable[[bytes], None], description: str = "Git command", timeout: Optional[int] = None ) -> GitCommandResult:
+        
+        # Run a read-only git command whose output can be large, passing each
+        # stdout line to line_handler as git writes it instead of buffering
+        # the whole output. The returned result carries no stdout
+        
+        if timeout is None:
+            timeout = self.config.timeout
+            
+        cmd_str = ' '.join(cmd)
+        argv, cwd = self._spawn_args(cmd)
+        timed_out = threading.Event()
+        
+        try:
+            
+            self.logger.debug(f"[>] Executing: {cmd_str}")
+            
+            with subprocess.Popen(
+                
+                argv,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=65536,
+                startupinfo=self.startupinfo,
+                creationflags=self.creation_flags,
+                close_fds=self.close_fds
+            ) as process:
                 
-        with ThreadPoolExecutor(max_workers=1) as executor:
+                def expire():
+                    timed_out.set()
+                    process.kill()
+                
+                killer = threading.Timer(timeout, expire)
+                killer.start()
+                
+                # stderr is drained on the pool so git can never block on a full pipe
+                stderr_future = self._executor.submit(process.stderr.read)
+                
+                try:
+                    
+                    for line in process.stdout:
+                        line_handler(line.rstrip(b'\n'))
+                        
+                    returncode = process.wait()
+                    stderr = stderr_future.result()
+                    
+                finally:
+                    
+                    killer.cancel()
+                    
+                    if process.poll() is None:
+                        process.kill()
             
-            try:
+            if timed_out.is_set():
                 
-                future = executor.submit(self._run_command_sync, cmd, description, timeout)
-                return future.result(timeout=timeout or self.config.timeout)
+                self.logger.error(f"[x] {description} timed out after {timeout} seconds")
+                return GitCommandResult(124, b"", f"Command timed out after {timeout}s".encode(), cmd_str)
+            
+            git_result = GitCommandResult(returncode, b"", stderr, cmd_str)
+            
+            if not git_result.success:
                 
-            except TimeoutError:
+                self.logger.error(f"[x] {description} failed (exit code {git_result.returncode})")
                 
-                self.logger.error(f"[x] {description} async timeout")
-                return GitCommandResult(124, "", "Async timeout", ' '.join(cmd))
+                if git_result.stderr.strip():
+                    self.logger.error(f"[x] Error: {git_result.stderr_text.strip()}")
+            
+            # Handle common warnings (non-critical)
+            if git_result.stderr.strip():
+                self._handle_git_warnings(git_result.stderr_text, description)
+            
+            return git_result
+            
+        except Exception as e:
+            
+            self.logger.error(f"[x] {description} failed: {e}")
+            return GitCommandResult(1, b"", str(e).encode('utf-8', errors='replace'), cmd_str)
+        
+        
+    def _run_command_async( self, cmd: List[str], description: str = "Git command", timeout: Optional[int] = None ) -> GitCommandResult:
+        
+        # Remote commands (fetch/pull/push). subprocess.run already enforces
+        # the timeout, so handing the call to another thread only to wait on
+        # it again bought nothing - run it on the calling thread
+            
+        return self._run_command_sync(cmd, description, timeout)
 
 
     def _handle_git_warnings( self, stderr: str, description: str ) -> None:
 
-        warning_patterns = [
-            
-            "lf will be replaced by crlf",
-            "crlf will be replaced by lf", 
-            "warning: adding embedded git repository",
-            "branch 'main' set up to track",
-            "branch            main       -> fetch_head",
-            "[new branch]      main       -> origin/main",
-            "to https://github.com",
-            "main -> main",
-            "fast-forward"
-        ]
-        
-        stderr_lower = stderr.lower()
-        
         # Only log as warning if it's not a known non-critical message
-        if not any(pattern in stderr_lower for pattern in warning_patterns):
+        if not _GIT_WARNING_RE.search(stderr):
             self.logger.warning(f"[!] {description} stderr: {stderr.strip()}")
 
 
@@ -191,7 +421,7 @@ class GitManager:
             self.logger.info("[+] Setting up Git repository...")
             
             # Initialize repository if not already a git repo
-            if not (self.vault_path / ".git").exists():
+            if not self._is_repository:
                 
                 self.logger.info("[+] Initializing new Git repository")
 
@@ -199,9 +429,12 @@ class GitManager:
                 if not result.success:
                     return False
                 
-                result = self._run_command_sync(["git", "branch", "-M", self.branch], "Set main branch")
-                if not result.success:
-                    self.logger.warning(f"[!] Could not set main branch to {self.branch}")
+                # Only rename when init did not already create the branch
+                if self._head_ref() != f"refs/heads/{self.branch}":
+                    
+                    result = self._run_command_sync(["git", "branch", "-M", self.branch], "Set main branch")
+                    if not result.success:
+                        self.logger.warning(f"[!] Could not set main branch to {self.branch}")
 
             self._configure_git_user()
             
@@ -219,29 +452,45 @@ class GitManager:
             return False
         
         
+    def _head_ref( self ) -> Optional[str]:
+
+        # Branch ref HEAD points at ('refs/heads/<name>', also for an unborn
+        # branch), None when detached. Asked of git rather than read from
+        # .git/HEAD, which is a gitfile in worktrees and submodules
+
+        result = self._run_command_sync(["git", "symbolic-ref", "--quiet", "HEAD"], "Read HEAD")
+
+        if not result.success:
+            return None
+
+        return result.stdout_text.strip()
+
+
     def _configure_git_user( self ) -> None:
         
-        # Configure Git username and email
-
-        result = self._run_command_sync(
-            
-            ["git", "config", "user.name", self.config.user_name], 
-            "Set user name"
-        )
+        # Store the configured identity in the repository config once, so
+        # commits made by hand in the vault keep using it. VaultSync's own
+        # commands pass it with -c and do not depend on this. Only values
+        # that differ are written, so a set-up vault costs one read
         
-        if result.success:
-            self.logger.debug(f"[+] Git user name set to: {self.config.user_name}")
+        local_config = {}
+        result = self._run_command_sync(["git", "config", "--local", "--list"], "Read repository config")
         
-        result = self._run_command_sync(
-            
-            ["git", "config", "user.email", self.config.user_email], 
-            "Set user email"
-        )
+        for line in result.stdout_text.splitlines():
+            key, _, value = line.partition("=")
+            local_config[key] = value
         
-        if result.success:
-            self.logger.debug(f"[+] Git user email set to: {self.config.user_email}")
-
-
+        for key, value in (("user.name", self.config.user_name), ("user.email", self.config.user_email)):
+            
+            if local_config.get(key) == value:
+                continue
+            
+            result = self._run_command_sync(["git", "config", key, value], f"Set {key}")
+            
+            if result.success:
+                self.logger.debug(f"[+] Git {key} set to: {value}")
+    
+    
     def _setup_remote( self ) -> bool:
         
         # Setup Git remote origin with validation
@@ -261,7 +510,7 @@ class GitManager:
             
         else:
             
-            current_remote = result.stdout.strip()
+            current_remote = result.stdout_text.strip()
             
             # Extract repo part for comparison (ignore token differences)
             current_repo = self._extract_repo_from_url(current_remote)
@@ -300,41 +549,44 @@ class GitManager:
             return url
     
     
-    def _create_gitignore( self ) -> None:
+    def _build_gitignore( self ) -> bytes:
 
-        gitignore_path = self.vault_path / ".gitignore"
+        # Render the .gitignore for the configured patterns; the config does
+        # not change while VaultSync runs, so this is done once per instance
+
+        if self._gitignore_cache is not None:
+            return self._gitignore_cache
+
+        gitignore = self.config.gitignore
         
-        gitignore_sections = []
+        # Build gitignore content from configuration: one block per
+        # non-empty section, blocks separated by a blank line
+        body = "\n\n".join(
+            "\n".join([section_header, *gitignore[section_key]])
+            for section_key, section_header in _GITIGNORE_SECTIONS
+            if gitignore.get(section_key)
+        )
         
-        # Build gitignore content from configuration
-        section_configs = [
-            ('obsidian', "# Obsidian workspace (user-specific)"),
-            ('system', "# System files"),
-            ('directories', "# Directories"),
-            ('custom', "# Custom patterns")
-        ]
+        new_content = _GITIGNORE_HEADER + body + _GITIGNORE_FOOTER
         
-        for section_key, section_header in section_configs:
+        self._gitignore_cache = new_content.encode('utf-8')
+        return self._gitignore_cache
 
-            if section_key in self.config.gitignore and self.config.gitignore[section_key]:
 
-                gitignore_sections.append(section_header)
-                gitignore_sections.extend(self.config.gitignore[section_key])
-                gitignore_sections.append("")
-        
-        new_content = f"""# .gitignore generated by VaultSync
-# Edit patterns in config.yaml under git.gitignore section
-
-{chr(10).join(gitignore_sections).rstrip()}
+    def _create_gitignore( self ) -> None:
 
-# End of VaultSync .gitignore
-"""
+        gitignore_path = self.vault_path / ".gitignore"
+        new_bytes = self._build_gitignore()
         
         try:
-            if gitignore_path.exists():
-                existing_content = gitignore_path.read_text(encoding='utf-8')
+            existed = gitignore_path.exists()
+            
+            if existed:
+                existing_bytes = gitignore_path.read_bytes()
 
-                if existing_content.strip() == new_content.strip():
+                # Exact match first; the strip() comparison only runs when the
+                # file differs, to tolerate surrounding whitespace as before
+                if existing_bytes == new_bytes or existing_bytes.strip() == new_bytes.strip():
                     self.logger.debug("[+] .gitignore is already up to date - no changes needed")
                     return
                 else:
@@ -342,10 +594,18 @@ class GitManager:
             else:
                 self.logger.debug("[+] Creating new .gitignore file")
 
-            # Write the file only if it doesn't exist or content changed
-            gitignore_path.write_text(new_content, encoding='utf-8')
+            # Write the file only if it doesn't exist or content changed, via
+            # a temp file so git never sees a half-written .gitignore
+            tmp_path = gitignore_path.with_name(".gitignore.tmp")
+            
+            try:
+                tmp_path.write_bytes(new_bytes)
+                os.replace(tmp_path, gitignore_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
-            action = "updated" if gitignore_path.exists() else "created"
+            action = "updated" if existed else "created"
             self.logger.debug(f"[+] .gitignore file {action} successfully")
             
             configured_sections = [k for k, v in self.config.gitignore.items() if v]
@@ -356,17 +616,60 @@ class GitManager:
             self.logger.error(f"[x] Failed to create .gitignore: {e}")
             
 
+    def _resolve_ref( self, ref: str ) -> Optional[bytes]:
+
+        # Resolve a ref to its object id. Lookups go through one persistent
+        # 'git cat-file --batch-check' process (a write and a readline)
+        # instead of a git spawn each; if that process cannot be used,
+        # fall back to 'git rev-parse --verify'
+
+        with self._ref_lock:
+            
+            try:
+                
+                if self._ref_process is None or self._ref_process.poll() is not None:
+                    
+                    argv, cwd = self._spawn_args(["git", "cat-file", "--batch-check=%(objectname)"])
+                    
+                    self._ref_process = subprocess.Popen(
+                        
+                        argv,
+                        cwd=cwd,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        startupinfo=self.startupinfo,
+                        creationflags=self.creation_flags,
+                        close_fds=self.close_fds
+                    )
+                
+                self._ref_process.stdin.write(ref.encode('utf-8') + b"\n")
+                self._ref_process.stdin.flush()
+                answer = self._ref_process.stdout.readline().rstrip(b"\n")
+                
+                # An empty answer means the helper exited (e.g. not a repository
+                # yet). Anything but an object id ('<ref> missing', '<ref>
+                # ambiguous', ...) means the ref does not resolve
+                if answer:
+                    return answer if _OID_RE.fullmatch(answer) else None
+                
+            except OSError:
+                pass
+        
+        result = self._run_command_sync(["git", "rev-parse", "--verify", "--quiet", ref], f"Resolve {ref}")
+        return result.stdout.strip() if result.success else None
+
+
     def _has_commits( self ) -> bool:
 
         # Check if there are any commits in the repository
             
-        result = self._run_command_sync(["git", "rev-parse", "HEAD"], "Check commits")
-        return result.success
+        return self._resolve_ref("HEAD") is not None
 
 
-    def _remote_branch_exists( self ) -> bool:
+    def _remote_branch_sha( self ) -> Optional[bytes]:
 
-        # Check if the remote branch exists
+        # Commit the remote branch points at, None if it does not exist
         
         result = self._run_command_sync(
             
@@ -374,71 +677,143 @@ class GitManager:
             "Check remote branch"
         )
         
-        return result.success and result.stdout.strip()
+        if not result.success:
+            return None
+        
+        # The pattern also matches e.g. refs/heads/<x>/<branch>, prefer the exact ref
+        ref = f"refs/heads/{self.branch}".encode()
+        entries = [line.split(b"\t", 1) for line in result.stdout.splitlines() if b"\t" in line]
         
+        for sha, name in entries:
+            if name == ref:
+                return sha
+            
+        return entries[0][0] if entries else None
 
-    def _has_local_changes( self ) -> bool:
 
-        # Check if there are any local uncommitted changes
+    def _remote_branch_exists( self ) -> bool:
+
+        # Check if the remote branch exists
+        
+        return self._remote_branch_sha() is not None
         
-        result = self._run_command_sync(["git", "status", "--porcelain"], "Status check")
-        return result.success and result.stdout.strip()
 
-    def _get_local_changes_count( self ) -> Dict[str, int]:
+    def _collect_repo_state( self ) -> Optional[Dict[str, Any]]:
+
+        # One 'git status --porcelain=v2 --branch' gives both the working tree
+        # changes and the ahead/behind counts against the upstream. The result
+        # is reused until a repository-modifying command runs or the next
+        # pull/push starts
+
+        if self._state_cache is not None:
+            return self._state_cache
+
+        state = {
+            "head": None,
+            "upstream": None,
+            "ahead": None,
+            "behind": None,
+            "dirty": False,
+            "changes": {"modified": 0, "added": 0, "deleted": 0, "untracked": 0}
+        }
+        counts = Counter()
+
+        def parse_line( line: bytes ) -> None:
+
+            if not line:
+                return
+
+            # Only the few '# branch.*' header lines are decoded
+            if line[0] == 35:  # '#'
+
+                key, _, value = line[2:].decode('utf-8', errors='replace').partition(' ')
+
+                if key == 'branch.head':
+                    state["head"] = value
+
+                elif key == 'branch.upstream':
+                    state["upstream"] = value
+
+                elif key == 'branch.ab':
+                    ahead, behind = value.split()
+                    state["ahead"] = int(ahead[1:])
+                    state["behind"] = int(behind[1:])
+
+                return
 
-        result = self._run_command_sync(["git", "status", "--porcelain"], "Status check")
+            state["dirty"] = True
+
+            # Ordinary (1), renamed/copied (2) and unmerged (u) entries carry
+            # the XY status at bytes 2-3, untracked entries are '? <path>'.
+            # Indexing bytes yields ints, so no per-line slices are made
+            if line[0] in _XY_ENTRY_TYPES:
+                category = _STATUS_MAP.get(line[2]) or _STATUS_MAP.get(line[3])
+            else:
+                category = _STATUS_MAP.get(line[0])
+
+            if category:
+                counts[category] += 1
+
+        result = self._run_command_streaming(
+            ["git", "status", "--porcelain=v2", "--branch"],
+            parse_line,
+            "Status check"
+        )
 
         if not result.success:
-            return {"modified": 0, "added": 0, "deleted": 0, "untracked": 0}
+            return None
 
-        changes = {"modified": 0, "added": 0, "deleted": 0, "untracked": 0}
+        state["changes"].update(counts)
 
-        for line in result.stdout.splitlines():
-            if not line.strip():
-                continue
+        self._state_cache = state
+        return state
 
-            status = line[:2]
+    def _has_local_changes( self ) -> bool:
 
-            if status.startswith('M') or status.endswith('M'):
-                changes["modified"] += 1
+        # Check if there are any local uncommitted changes
+        
+        state = self._collect_repo_state()
+        return state is not None and state["dirty"]
 
-            elif status.startswith('A') or status.endswith('A'):
-                changes["added"] += 1
+    def _get_local_changes_count( self ) -> Dict[str, int]:
 
-            elif status.startswith('D') or status.endswith('D'):
-                changes["deleted"] += 1
+        state = self._collect_repo_state()
 
-            elif status.startswith('??'):
-                changes["untracked"] += 1
+        if state is None:
+            return {"modified": 0, "added": 0, "deleted": 0, "untracked": 0}
 
-        return changes
+        return dict(state["changes"])
 
     def _check_divergence( self ) -> Dict[str, any]:
 
         # Check if local branch has diverged from remote
 
-        local_result = self._run_command_sync(
-            ["git", "rev-parse", self.branch],
-            "Get local commit"
-        )
+        # The status snapshot already has the counts when the branch tracks origin/<branch>
+        state = self._collect_repo_state()
 
-        # Get remote commit
-        remote_result = self._run_command_sync(
-            ["git", "rev-parse", f"origin/{self.branch}"],
-            "Get remote commit"
-        )
+        if (state is not None and state["head"] == self.branch
+                and state["upstream"] == f"origin/{self.branch}" and state["ahead"] is not None):
 
-        if not local_result.success or not remote_result.success:
-            return {"diverged": False, "ahead": 0, "behind": 0}
+            ahead, behind = state["ahead"], state["behind"]
+
+            return {
+                "diverged": ahead > 0 and behind > 0,
+                "ahead": ahead,
+                "behind": behind
+            }
 
-        local_commit = local_result.stdout.strip()
-        remote_commit = remote_result.stdout.strip()
+        local_commit = self._resolve_ref(self.branch)
+        remote_commit = self._resolve_ref(f"origin/{self.branch}")
+
+        if local_commit is None or remote_commit is None:
+            return {"diverged": False, "ahead": 0, "behind": 0}
 
         if local_commit == remote_commit:
             return {"diverged": False, "ahead": 0, "behind": 0}
 
-        # Count commits ahead
-        ahead_result = self._run_command_sync(
+        # Count commits ahead (on the pool) and behind (here) at the same time
+        ahead_future = self._executor.submit(
+            self._run_command_sync,
             ["git", "rev-list", "--count", f"origin/{self.branch}..{self.branch}"],
             "Count ahead"
         )
@@ -449,6 +824,8 @@ class GitManager:
             "Count behind"
         )
 
+        ahead_result = ahead_future.result()
+
         ahead = int(ahead_result.stdout.strip()) if ahead_result.success else 0
         behind = int(behind_result.stdout.strip()) if behind_result.success else 0
 
@@ -462,10 +839,15 @@ class GitManager:
 
         self.logger.debug("[+] Verifying repository integrity...")
 
-        if not (self.vault_path / ".git").exists():
+        if not os.path.exists(self._git_dir):
             self.logger.error("[x] .git directory not found")
             return False
 
+        # fsck walks the whole object store; a clean result is trusted for
+        # git.fsck_interval seconds (0 checks on every pull/push)
+        if self._last_fsck is not None and time.monotonic() - self._last_fsck < self.config.fsck_interval:
+            return True
+
         fsck_result = self._run_command_sync(
             ["git", "fsck", "--no-progress"],
             "Verify repository",
@@ -476,40 +858,91 @@ class GitManager:
             self.logger.warning("[!] Repository integrity check found issues")
             return True
 
+        self._last_fsck = time.monotonic()
         self.logger.debug("[+] Repository integrity verified")
         return True
 
 
+    def prefetch( self ) -> None:
+
+        # Network half of pull(): ls-remote and fetch. It only writes inside
+        # .git, so it can overlap work that reads the vault (the startup
+        # backup). The next pull() uses the result instead of fetching again;
+        # on any failure it is simply dropped and pull() does its own fetch
+
+        self._prefetched_sha = None
+
+        try:
+
+            remote_sha = self._remote_branch_sha()
+
+            if remote_sha is None:
+                return
+
+            # Unchanged remote: nothing to fetch, but pull() can still skip
+            # its own ls-remote
+            if remote_sha == self._last_remote_sha:
+                self._prefetched_sha = remote_sha
+                return
+
+            fetch_result = self._run_command_async(
+                ["git", "fetch", "origin", self.branch],
+                "Fetch remote changes",
+                timeout=self.config.timeout // 2
+            )
+
+            if fetch_result.success:
+                self._state_cache = None
+                self._prefetched_sha = remote_sha
+
+        except Exception as e:
+            self.logger.debug(f"[!] Prefetch failed, pull will fetch: {e}")
+
+
     def pull( self ) -> bool:
 
         try:
             self.logger.info("[+] Pulling changes from remote...")
+            self._state_cache = None
             
             if not self._verify_repository_integrity():
                 self.logger.error("[x] Repository integrity check failed")
                 return False
 
-            if not self._remote_branch_exists():
+            # A prefetch() just before us already did the network round-trips
+            prefetched, self._prefetched_sha = self._prefetched_sha, None
+            remote_sha = prefetched or self._remote_branch_sha()
+
+            if remote_sha is None:
                 self.logger.info("[*] Remote branch doesn't exist yet - normal for new repositories")
                 return True
             
-            self.logger.debug("[+] Fetching latest changes from remote...")
-            fetch_result = self._run_command_async(
-                ["git", "fetch", "origin", self.branch],
-                "Fetch remote changes",
-                timeout=self.config.timeout // 2
-            )
+            # ls-remote is one round-trip; if the remote has not moved since
+            # the last pull there is nothing to fetch
+            if remote_sha == self._last_remote_sha:
+                self.logger.info("[*] Already up to date with remote")
+                return True
             
-            if not fetch_result.success:
-                if "couldn't find remote ref" in fetch_result.stderr.lower():
-                    self.logger.info("[*] Remote branch doesn't exist yet")
-                    return True
-                self.logger.error("[x] Failed to fetch from remote")
-                return False
+            if prefetched is None:
+                
+                self.logger.debug("[+] Fetching latest changes from remote...")
+                fetch_result = self._run_command_async(
+                    ["git", "fetch", "origin", self.branch],
+                    "Fetch remote changes",
+                    timeout=self.config.timeout // 2
+                )
+                
+                if not fetch_result.success:
+                    if b"couldn't find remote ref" in fetch_result.stderr.lower():
+                        self.logger.info("[*] Remote branch doesn't exist yet")
+                        return True
+                    self.logger.error("[x] Failed to fetch from remote")
+                    return False
             
             divergence = self._check_divergence()
 
             if divergence["behind"] == 0:
+                self._last_remote_sha = remote_sha
                 self.logger.info("[*] Already up to date with remote")
                 return True
 
@@ -533,7 +966,7 @@ class GitManager:
                     self.logger.info("[+] Stashing local changes before pull...")
                     stash_result = self._run_command_sync([
                         "git", "stash", "push", "-u", "-m",
-                        f"Auto-stash before pull {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        f"Auto-stash before pull {time.strftime('%Y-%m-%d %H:%M:%S')}"
                     ], "Stash changes")
 
                     stashed = stash_result.success
@@ -558,6 +991,7 @@ class GitManager:
                 )
 
             if pull_result.success:
+                self._last_remote_sha = remote_sha
                 self.logger.info("[+] Successfully pulled changes from remote")
 
                 # Restore stashed changes if any
@@ -567,7 +1001,7 @@ class GitManager:
                     
                     if not pop_result.success:
 
-                        if "conflict" in pop_result.stderr.lower() or "merge" in pop_result.stderr.lower():
+                        if b"conflict" in pop_result.stderr.lower() or b"merge" in pop_result.stderr.lower():
 
                             self.logger.error("[x] Conflict detected while restoring stashed changes")
                             self.logger.error("[!] Conflicts must be resolved manually")
@@ -584,7 +1018,7 @@ class GitManager:
             else:
                 # Analyze pull failure
 
-                if "conflict" in pull_result.stderr.lower():
+                if b"conflict" in pull_result.stderr.lower():
                     self.logger.error("[x] Merge conflict detected during pull")
                     self.logger.error("[!] Aborting rebase to prevent data loss...")
 
@@ -598,7 +1032,7 @@ class GitManager:
                     self.logger.error("[!] Manual conflict resolution required")
                     return False
 
-                self.logger.error(f"[x] Pull failed: {pull_result.stderr}")
+                self.logger.error(f"[x] Pull failed: {pull_result.stderr_text}")
 
                 # Try to restore previous state
                 if stashed:
@@ -616,6 +1050,7 @@ class GitManager:
 
         try:
             self.logger.info("[+] Pushing changes to remote...")
+            self._state_cache = None
 
             if not self._verify_repository_integrity():
                 self.logger.error("[x] Repository integrity check failed")
@@ -652,7 +1087,7 @@ class GitManager:
                 self.logger.info("[*] No changes to commit after staging (possibly only ignored files)")
                 return True
 
-            commit_msg = f"VaultSync: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            commit_msg = f"VaultSync: {time.strftime('%Y-%m-%d %H:%M:%S')}"
             self.logger.debug(f"[+] Creating commit: {commit_msg}")
 
             commit_result = self._run_command_sync(
@@ -662,7 +1097,7 @@ class GitManager:
             
             if not commit_result.success:
 
-                if "nothing to commit" in commit_result.stdout.lower():
+                if b"nothing to commit" in commit_result.stdout.lower():
                     self.logger.info("[*] Nothing new to commit")
                     return True
                 else:
@@ -723,7 +1158,7 @@ class GitManager:
                 return True
             else:
 
-                stderr_lower = push_result.stderr.lower()
+                stderr_lower = push_result.stderr_text.lower()
 
                 if "rejected" in stderr_lower or "non-fast-forward" in stderr_lower:
 
@@ -758,13 +1193,12 @@ class GitManager:
                     return False
 
                 else:
-                    self.logger.error(f"[x] Push failed: {push_result.stderr}")
+                    self.logger.error(f"[x] Push failed: {push_result.stderr_text}")
                     return False
 
         except Exception as e:
 
             self.logger.error(f"[x] Push operation failed: {e}")
-            import traceback
             self.logger.debug(traceback.format_exc())
             return False
 
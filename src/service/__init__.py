@@ -3,11 +3,11 @@
 Service module for VaultSync background process management.
 """
 
-from service.process_manager import ProcessManager
-from service.autorun_manager import AutorunManager
-from service.config_validator import ConfigValidator
-from service.config_display import ConfigDisplay
-from service.service_handler import ServiceHandler
+from .process_manager import ProcessManager
+from .autorun_manager import AutorunManager
+from .config_validator import ConfigValidator
+from .config_display import ConfigDisplay
+from .service_handler import ServiceHandler
 
 __all__ = [
     'ProcessManager',
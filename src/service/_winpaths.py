@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Windows interpreter paths for VaultSync.
+Resolves the console-less interpreter used for background and autorun starts.
+"""
+
+import sys
+from pathlib import Path
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _pythonw_executable() -> str:
+
+    # pythonw.exe next to the running python.exe, so no console window is
+    # opened; falls back to the current interpreter when it is missing
+    python_executable = sys.executable
+
+    if python_executable.endswith('python.exe'):
+        pythonw_executable = python_executable.replace('python.exe', 'pythonw.exe')
+
+        if Path(pythonw_executable).exists():
+            return pythonw_executable
+
+    return python_executable
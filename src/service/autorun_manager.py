@@ -9,6 +9,8 @@ import winreg
 from pathlib import Path
 from typing import Optional
 
+from ._winpaths import _pythonw_executable
+
 
 class AutorunManager:
 
@@ -19,6 +21,7 @@ class AutorunManager:
         self.base_dir = base_dir
         self.startup_key = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
         self.app_name = "VaultSync"
+        self.main_script = self.base_dir / "VaultSync.py"
 
     def enable( self ) -> bool:
 
@@ -29,16 +32,8 @@ class AutorunManager:
         try:
             print("\n[+] Enabling VaultSync auto-run on Windows boot...")
 
-            main_script = self.base_dir / "VaultSync.py"
-
             # Hide console window
-            python_executable = sys.executable
-            if python_executable.endswith('python.exe'):
-                pythonw_executable = python_executable.replace('python.exe', 'pythonw.exe')
-            else:
-                pythonw_executable = python_executable
-
-            startup_command = f'"{pythonw_executable}" "{main_script}" --background'
+            startup_command = f'"{_pythonw_executable()}" "{self.main_script}" --background'
 
             with winreg.OpenKey(
 
@@ -81,14 +76,8 @@ class AutorunManager:
             return False
 
         try:
-            if not self.is_enabled():
-                print("\n[*] VaultSync auto-run is not enabled\n")
-                return True
-
-            print("\n[+] Disabling VaultSync auto-run...")
-            print(f"[*] Removing registry key (HKEY_CURRENT_USER\\{self.startup_key}\\{self.app_name})")
-
-            # Open Windows Registry key for startup programs
+            # Open Windows Registry key for startup programs; a missing value
+            # means auto-run was never enabled, so no separate lookup is needed
             with winreg.OpenKey(
 
                 winreg.HKEY_CURRENT_USER,
@@ -97,8 +86,14 @@ class AutorunManager:
                 winreg.KEY_SET_VALUE
 
             ) as key:
-                winreg.DeleteValue(key, self.app_name)
+                try:
+                    winreg.DeleteValue(key, self.app_name)
+                except FileNotFoundError:
+                    print("\n[*] VaultSync auto-run is not enabled\n")
+                    return True
 
+            print("\n[+] Disabling VaultSync auto-run...")
+            print(f"[*] Removing registry key (HKEY_CURRENT_USER\\{self.startup_key}\\{self.app_name})")
             print("[+] VaultSync auto-run disabled")
             print("[+] VaultSync will no longer run automatically on Windows boot\n")
 
@@ -114,52 +109,42 @@ class AutorunManager:
 
     def is_enabled( self ) -> bool:
 
-        if sys.platform != "win32":
-            return False
-
-        try:
-            with winreg.OpenKey(
-
-                winreg.HKEY_CURRENT_USER,
-                self.startup_key,
-                0,
-                winreg.KEY_READ
+        return self._read() is not None
 
-            ) as key:
-                try:
-                    value, _ = winreg.QueryValueEx(key, self.app_name)
-                    return True
-                except FileNotFoundError:
-                    return False
+    def get_command( self ) -> Optional[str]:
 
-        except Exception:
-            return False
+        return self._read()
 
-    def get_command( self ) -> Optional[str]:
+    def _read( self ) -> Optional[str]:
 
+        # Registered startup command, or None when auto-run is not enabled
         if sys.platform != "win32":
             return None
 
         try:
             with winreg.OpenKey(
+
                 winreg.HKEY_CURRENT_USER,
                 self.startup_key,
                 0,
                 winreg.KEY_READ
+
             ) as key:
                 try:
                     value, _ = winreg.QueryValueEx(key, self.app_name)
                     return value
                 except FileNotFoundError:
                     return None
+
         except Exception:
             return None
 
     def get_status_info( self ) -> dict:
 
+        command = self._read()
+
         return {
-            'enabled': self.is_enabled(),
-            'command': self.get_command(),
+            'enabled': command is not None,
+            'command': command,
             'registry_path': f"HKEY_CURRENT_USER\\{self.startup_key}\\{self.app_name}"
         }
-
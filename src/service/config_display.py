@@ -4,9 +4,16 @@ Configuration display for VaultSync.
 Pretty-prints configuration using tree structure.
 """
 
-import yaml
+import sys
 from pathlib import Path
-from anytree import Node, RenderTree
+from typing import List, Tuple
+
+
+# Tree entries in preorder: (depth, label), the root at depth 0
+Tree = List[Tuple[int, str]]
+
+# Mask for the hidden middle of a token, sliced rather than rebuilt per call
+_STARS = '*' * 1024
 
 
 class ConfigDisplay:
@@ -21,146 +28,172 @@ class ConfigDisplay:
     def show_config( self ) -> None:
 
         try:
-            self._show_config_with_anytree()
+            self._show_config_tree()
         except Exception as e:
             print(f"[x] Config display error: {e}")
 
-    def _show_config_with_anytree( self ) -> None:
+    def _show_config_tree( self ) -> None:
 
-        root = Node("\n📁 VaultSync Configuration")
+        tree: Tree = [(0, "\n📁 VaultSync Configuration")]
 
-        self._add_file_info(root)
+        self._add_file_info(tree)
 
         if self.config_file.exists():
-            self._add_config_yaml_tree(root)
+            self._add_config_yaml_tree(tree)
         else:
-            Node("[x] config.yaml not found", parent=root)
+            tree.append((1, "[x] config.yaml not found"))
 
         if self.env_file.exists():
-            self._add_env_tree(root)
+            self._add_env_tree(tree)
         else:
-            Node("[x] .env not found", parent=root)
+            tree.append((1, "[x] .env not found"))
+
+        sys.stdout.write(self._render_tree(tree) + "\n")
+        sys.stdout.flush()
+
+    def _render_tree( self, tree: Tree ) -> str:
+
+        # A node is the last child of its parent when no sibling follows it
+        # before a shallower node does; found in one backward pass
+        is_last = [False] * len(tree)
+        pending = set()
+
+        for i in range(len(tree) - 1, -1, -1):
+            depth = tree[i][0]
+            pending = {d for d in pending if d <= depth}
+            is_last[i] = depth not in pending
+            pending.add(depth)
 
-        for pre, fill, node in RenderTree(root):
-            print(f"{pre}{node.name}")
+        # Forward pass: each ancestor contributes a rail or a gap, the node
+        # itself a branch or a corner
+        lines = []
+        rails = []
 
-        print()
+        for (depth, label), last in zip(tree, is_last):
 
-    def _add_file_info( self, root: Node ) -> None:
+            if depth == 0:
+                lines.append(f"{label}\n")
+                continue
 
-        files_node = Node("📂 Files", parent=root)
-        Node(f"📄 Config: {self.config_file.name}", parent=files_node)
-        Node(f"🔑 Environment: {self.env_file.name}", parent=files_node)
-        Node(f"📁 Directory: {self.base_dir}", parent=files_node)
+            del rails[depth - 1:]
+            prefix = "".join("    " if done else "│   " for done in rails)
+            lines.append(f"{prefix}{'└── ' if last else '├── '}{label}\n")
+            rails.append(last)
 
-    def _add_config_yaml_tree(self, root: Node) -> None:
+        return "".join(lines)
 
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+    def _add_file_info( self, tree: Tree ) -> None:
 
-        config_node = Node("📋 config.yaml", parent=root)
+        tree.append((1, "📂 Files"))
+        tree.append((2, f"📄 Config: {self.config_file.name}"))
+        tree.append((2, f"🔑 Environment: {self.env_file.name}"))
+        tree.append((2, f"📁 Directory: {self.base_dir}"))
+
+    def _add_config_yaml_tree(self, tree: Tree) -> None:
+
+        from ..config.config_manager import _load_yaml_file
+
+        config = _load_yaml_file(self.config_file)
+
+        tree.append((1, "📋 config.yaml"))
 
         # Vault section
-        self._add_vault_section(config, config_node)
+        self._add_vault_section(config.get('vault') or {}, tree)
 
         # Sync section
-        self._add_sync_section(config, config_node)
+        self._add_sync_section(config.get('sync') or {}, tree)
 
         # Backup section
-        self._add_backup_section(config, config_node)
+        self._add_backup_section(config.get('backup') or {}, tree)
 
         # Logging section
-        self._add_logging_section(config, config_node)
+        self._add_logging_section(config.get('logging') or {}, tree)
 
         # Notification section
-        self._add_notification_section(config, config_node)
+        self._add_notification_section(config.get('notification') or {}, tree)
 
         # Git section
-        self._add_git_section(config, config_node)
+        self._add_git_section(config.get('git') or {}, tree)
 
-    def _add_vault_section( self, config: dict, parent: Node ) -> None:
+    def _add_vault_section( self, vault: dict, tree: Tree ) -> None:
 
-        vault_node = Node("📁 Vault", parent=parent)
-        Node(f"path: {config.get('vault', {}).get('path', 'NOT SET')}", parent=vault_node)
-        Node(f"branch: {config.get('vault', {}).get('branch', 'main')}", parent=vault_node)
+        tree.append((2, "📁 Vault"))
+        tree.append((3, f"path: {vault.get('path', 'NOT SET')}"))
+        tree.append((3, f"branch: {vault.get('branch', 'main')}"))
 
-    def _add_sync_section( self, config: dict, parent: Node ) -> None:
+    def _add_sync_section( self, sync: dict, tree: Tree ) -> None:
 
-        sync_node = Node("⚙️  Sync", parent=parent)
-        Node(f"mode: {config.get('sync', {}).get('mode', 'on_close')}", parent=sync_node)
-        Node(f"interval_minutes: {config.get('sync', {}).get('interval_minutes', 2)}", parent=sync_node)
-        Node(f"process_name: {config.get('sync', {}).get('process_name', 'Obsidian.exe')}", parent=sync_node)
+        tree.append((2, "⚙️  Sync"))
+        tree.append((3, f"mode: {sync.get('mode', 'on_close')}"))
+        tree.append((3, f"interval_minutes: {sync.get('interval_minutes', 2)}"))
+        tree.append((3, f"process_name: {sync.get('process_name', 'Obsidian.exe')}"))
 
-    def _add_backup_section( self, config: dict, parent: Node ) -> None:
+    def _add_backup_section( self, backup: dict, tree: Tree ) -> None:
 
-        backup_enabled = config.get('backup', {}).get('enabled', True)
-        backup_node = Node("💾 Backup", parent=parent)
-        Node(f"enabled: {backup_enabled}", parent=backup_node)
+        backup_enabled = backup.get('enabled', True)
+        tree.append((2, "💾 Backup"))
+        tree.append((3, f"enabled: {backup_enabled}"))
 
         if backup_enabled:
-            Node(f"directory: {config.get('backup', {}).get('directory', 'NOT SET')}", parent=backup_node)
-            Node(f"max_backups: {config.get('backup', {}).get('max_backups', 2)}", parent=backup_node)
+            tree.append((3, f"directory: {backup.get('directory', 'NOT SET')}"))
+            tree.append((3, f"max_backups: {backup.get('max_backups', 2)}"))
 
-    def _add_logging_section( self, config: dict, parent: Node ) -> None:
+    def _add_logging_section( self, logging: dict, tree: Tree ) -> None:
 
-        logging_node = Node("📝 Logging", parent=parent)
-        Node(f"file: {config.get('logging', {}).get('file', 'VaultSync.log')}", parent=logging_node)
-        Node(f"level: {config.get('logging', {}).get('level', 'INFO')}", parent=logging_node)
+        tree.append((2, "📝 Logging"))
+        tree.append((3, f"file: {logging.get('file', 'VaultSync.log')}"))
+        tree.append((3, f"level: {logging.get('level', 'INFO')}"))
 
-    def _add_notification_section( self, config: dict, parent: Node ) -> None:
+    def _add_notification_section( self, notification: dict, tree: Tree ) -> None:
 
-        notification_enabled = config.get('notification', {}).get('enabled', True)
-        notification_node = Node("🔔 Notification", parent=parent)
-        Node(f"enabled: {notification_enabled}", parent=notification_node)
+        notification_enabled = notification.get('enabled', True)
+        tree.append((2, "🔔 Notification"))
+        tree.append((3, f"enabled: {notification_enabled}"))
 
         if notification_enabled:
-            Node(f"timeout: {config.get('notification', {}).get('timeout', 3)} seconds", parent=notification_node)
-            icon_path = config.get('notification', {}).get('icon_path')
-            Node(f"icon_path: {icon_path if icon_path else 'Default'}", parent=notification_node)
+            tree.append((3, f"timeout: {notification.get('timeout', 3)} seconds"))
+            icon_path = notification.get('icon_path')
+            tree.append((3, f"icon_path: {icon_path if icon_path else 'Default'}"))
 
-    def _add_git_section( self, config: dict, parent: Node ) -> None:
+    def _add_git_section( self, git: dict, tree: Tree ) -> None:
 
-        git_node = Node("🔗 Git", parent=parent)
-        Node(f"timeout: {config.get('git', {}).get('timeout', 120)} seconds", parent=git_node)
-        Node(f"user_name: {config.get('git', {}).get('user_name', 'NOT SET')}", parent=git_node)
-        Node(f"user_email: {config.get('git', {}).get('user_email', 'NOT SET')}", parent=git_node)
+        tree.append((2, "🔗 Git"))
+        tree.append((3, f"timeout: {git.get('timeout', 120)} seconds"))
+        tree.append((3, f"fsck_interval: {git.get('fsck_interval', 3600)} seconds"))
+        tree.append((3, f"user_name: {git.get('user_name', 'NOT SET')}"))
+        tree.append((3, f"user_email: {git.get('user_email', 'NOT SET')}"))
 
-        gitignore = config.get('git', {}).get('gitignore', {})
-        gitignore_node = Node("📝 gitignore", parent=git_node)
+        gitignore = git.get('gitignore', {})
+        tree.append((3, "📝 gitignore"))
 
         for section, patterns in gitignore.items():
             if patterns:
-                Node(f"{section}: {len(patterns)} pattern(s)", parent=gitignore_node)
+                tree.append((4, f"{section}: {len(patterns)} pattern(s)"))
             else:
-                Node(f"{section}: No patterns", parent=gitignore_node)
+                tree.append((4, f"{section}: No patterns"))
 
-    def _add_env_tree( self, root: Node ) -> None:
+    def _add_env_tree( self, tree: Tree ) -> None:
 
-        env_node = Node("🔐 .env", parent=root)
+        tree.append((1, "🔐 .env"))
 
-        with open(self.env_file, 'r', encoding='utf-8') as f:
+        from ..config.config_manager import _parse_env_file
 
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
+        for key, value in _parse_env_file(self.env_file).items():
 
-                    if key == 'GITHUB_TOKEN':
-                        if value:
-                            obfuscated = self._obfuscate_token(value)
-                            Node(f"{key}: {obfuscated}", parent=env_node)
-                        else:
-                            Node(f"{key}: NOT SET", parent=env_node)
-                    else:
-                        Node(f"{key}: {value if value else 'NOT SET'}", parent=env_node)
+            if key == 'GITHUB_TOKEN':
+                if value:
+                    obfuscated = self._obfuscate_token(value)
+                    tree.append((2, f"{key}: {obfuscated}"))
+                else:
+                    tree.append((2, f"{key}: NOT SET"))
+            else:
+                tree.append((2, f"{key}: {value if value else 'NOT SET'}"))
 
     def _obfuscate_token( self, token: str ) -> str:
 
-        if len(token) > 8:
-            return f"{token[:4]}{'*' * (len(token) - 8)}{token[-4:]}"
+        n = len(token)
+        if n > 8:
+            stars = _STARS[:n - 8] if n - 8 <= len(_STARS) else '*' * (n - 8)
+            return f"{token[:4]}{stars}{token[-4:]}"
         else:
             return "***"
-
-
@@ -4,7 +4,7 @@ Configuration validation for VaultSync.
 Validates config.yaml and .env files for required settings.
 """
 
-import yaml
+import importlib.util
 from pathlib import Path
 from typing import List
 
@@ -29,8 +29,11 @@ class ConfigValidator:
 
         try:
 
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            # Imported here so check_requirements can still report a missing
+            # yaml package instead of failing on import
+            from ..config.config_manager import _load_yaml_file
+
+            config = _load_yaml_file(self.config_file)
 
             env_vars = self._load_env_vars()
             missing_fields = self._check_required_fields(config, env_vars)
@@ -59,27 +62,24 @@ class ConfigValidator:
 
     def _load_env_vars( self ) -> dict:
 
-        env_vars = {}
-        with open(self.env_file, 'r', encoding='utf-8') as f:
+        from ..config.config_manager import _parse_env_file
 
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-        return env_vars
+        return _parse_env_file(self.env_file)
 
     def _check_required_fields(self, config: dict, env_vars: dict) -> List[str]:
 
         missing_fields = []
 
-        if not config.get('vault', {}).get('path'):
+        vault = config.get('vault') or {}
+        git   = config.get('git') or {}
+
+        if not vault.get('path'):
             missing_fields.append('vault.path')
 
-        if not config.get('git', {}).get('user_name'):
+        if not git.get('user_name'):
             missing_fields.append('git.user_name')
 
-        if not config.get('git', {}).get('user_email'):
+        if not git.get('user_email'):
             missing_fields.append('git.user_email')
 
         if not env_vars.get('GITHUB_TOKEN'):
@@ -117,23 +117,28 @@ class ConfigValidator:
 
         dependencies = [
             ('psutil', 'Process monitoring'),
-            ('schedule', 'Task scheduling'),
             ('plyer', 'Notifications'),
-            ('anytree', 'Tree display (optional)'),
+            ('yaml', 'YAML parser'),
         ]
 
+        # find_spec locates a package without executing it
         for module, description in dependencies:
-            try:
-                __import__(module.replace('-', '_'))
+            if importlib.util.find_spec(module.replace('-', '_')) is not None:
                 print(f"[+] {description}: {module}")
 
-            except ImportError:
+            else:
+                print(f"[-] {description}: {module}")
+                missing_items.append(module)
+
+        # The libyaml probe has to import yaml, so only once it is known to exist
+        if 'yaml' not in missing_items:
+
+            import yaml
 
-                if module == 'anytree':
-                    print(f"[*] {description}: {module} (using fallback)")
-                else:
-                    print(f"[-] {description}: {module}")
-                    missing_items.append(module)
+            if getattr(yaml, '__with_libyaml__', False):
+                print("[+] Fast YAML parser: libyaml")
+            else:
+                print("[*] Fast YAML parser: libyaml (using fallback)")
 
         if missing_items:
 
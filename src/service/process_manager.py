@@ -7,11 +7,12 @@ Handles starting, stopping, and monitoring the sync process.
 import sys
 import os
 import subprocess
-import psutil
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
+
+from ._winpaths import _pythonw_executable
 
 
 class ProcessManager:
@@ -21,8 +22,18 @@ class ProcessManager:
         self.base_dir = base_dir
         self.src_dir = self.base_dir / "src"
         self.sync_script = self.src_dir / "sync.py"
+        # Run as a module from base_dir so the src package imports resolve
+        self.sync_module = "src.sync"
         self.pid_file = self.base_dir / ".pid"
 
+        # (pid, mtime_ns) of the last .pid read and the matching process
+        # handle, so a status check parses the file and opens the process once
+        self._cached_pid: Optional[Tuple[int, int]] = None
+        self._process: Optional["psutil.Process"] = None
+
+        # psutil is imported by the methods that use it, so commands such as
+        # --config and --check do not pay for loading it
+
     def start_background( self ) -> bool:
 
         if self.is_running():
@@ -47,15 +58,9 @@ class ProcessManager:
 
     def _start_windows_background( self ) -> bool:
 
-        python_executable = sys.executable
-        if python_executable.endswith('python.exe'):
-            pythonw_executable = python_executable.replace('python.exe', 'pythonw.exe')
-
-            if not Path(pythonw_executable).exists():
-                print("[!] Warning: pythonw.exe not found, using python.exe (console may appear)")
-                pythonw_executable = python_executable
-        else:
-            pythonw_executable = python_executable
+        pythonw_executable = _pythonw_executable()
+        if pythonw_executable.endswith('python.exe'):
+            print("[!] Warning: pythonw.exe not found, using python.exe (console may appear)")
 
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -63,7 +68,7 @@ class ProcessManager:
 
         # Start completely detached process with no console
         process = subprocess.Popen(
-            [pythonw_executable, str(self.sync_script)],
+            [pythonw_executable, "-m", self.sync_module],
             cwd=self.base_dir,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -77,13 +82,13 @@ class ProcessManager:
             close_fds=True
         )
 
-        return self._finalize_startup()
+        return self._finalize_startup(process)
 
     def _start_unix_background( self ) -> bool:
 
 
         process = subprocess.Popen(
-            [sys.executable, str(self.sync_script)],
+            [sys.executable, "-m", self.sync_module],
             cwd=self.base_dir,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -92,14 +97,26 @@ class ProcessManager:
             close_fds=True
         )
 
-        return self._finalize_startup()
+        return self._finalize_startup(process)
+
+    def _finalize_startup( self, process: subprocess.Popen ) -> bool:
+
+        # The PID comes straight from Popen, so there is no need to scan the
+        # process table for it. A missing config or a crash on import only
+        # shows up once the interpreter has started, so the child has to
+        # survive a short window before it counts as started
+        vault_pid = None
+        deadline = time.monotonic() + 1.0
 
-    def _finalize_startup( self ) -> bool:
+        while time.monotonic() < deadline:
 
-        # Wait a moment to allow process to start
-        time.sleep(3)
+            if process.poll() is not None:
+                break
 
-        vault_pid = self.find_vault_process()
+            time.sleep(0.05)
+
+        else:
+            vault_pid = process.pid
 
         if vault_pid:
 
@@ -110,22 +127,30 @@ class ProcessManager:
             return True
 
         else:
-            print("[x] Failed to run VaultSync - process not found")
+            print("[x] Failed to run VaultSync - process exited during startup")
             print("[+] Check VaultSync.log for details")
             return False
 
     def find_vault_process( self ) -> Optional[int]:
 
+        import psutil
+
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            # Only the name is prefetched; cmdline is the expensive attribute
+            # and is read just for the few python processes
+            for proc in psutil.process_iter(['pid', 'name']):
                 try:
                     if proc.info['name']:
                         proc_name = proc.info['name'].lower()
 
                         if 'python' in proc_name or 'pythonw' in proc_name:
-                            cmdline = proc.info['cmdline']
+                            cmdline = proc.cmdline()
 
-                            if cmdline and any('sync.py' in str(arg) for arg in cmdline):
+                            # Interpreter plus at least the script or -m module
+                            if len(cmdline) < 2:
+                                continue
+
+                            if self.sync_module in cmdline or 'sync.py' in '\0'.join(cmdline):
                                 return proc.info['pid']
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -136,13 +161,14 @@ class ProcessManager:
 
     def stop_background(self) -> bool:
 
+        import psutil
+
         if not self.is_running():
             print("[*] VaultSync is not running")
             return False
 
         try:
-            pid = int(self.pid_file.read_text().strip())
-            process = psutil.Process(pid)
+            process = self._process
 
             print("\n[+] Stopping VaultSync background process...")
             process.terminate()
@@ -156,6 +182,9 @@ class ProcessManager:
             if self.pid_file.exists():
                 self.pid_file.unlink()
 
+            self._cached_pid = None
+            self._process = None
+
             print("[+] VaultSync process stopped.\n")
             return True
 
@@ -163,22 +192,44 @@ class ProcessManager:
             print(f"[x] Error stopping process: {e}")
             return False
 
+    def _read_pid( self ) -> Optional[int]:
+
+        # PID from .pid, re-read only when the file's mtime changes
+        try:
+            mtime_ns = self.pid_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cached_pid = None
+            return None
+
+        if self._cached_pid is not None and self._cached_pid[1] == mtime_ns:
+            return self._cached_pid[0]
+
+        pid = int(self.pid_file.read_text().strip())
+        self._cached_pid = (pid, mtime_ns)
+        return pid
+
     def is_running(self) -> bool:
 
-        if not self.pid_file.exists():
-            return False
+        import psutil
 
         try:
-            pid = int(self.pid_file.read_text().strip())
+            pid = self._read_pid()
+            if pid is None:
+                return False
 
             if psutil.pid_exists(pid):
-                process = psutil.Process(pid)
+
+                if self._process is None or self._process.pid != pid:
+                    self._process = psutil.Process(pid)
+
+                process = self._process
                 proc_name = process.name().lower()
 
                 return process.is_running() and ('python' in proc_name or 'pythonw' in proc_name)
             else:
 
                 self.pid_file.unlink()
+                self._cached_pid = None
                 return False
 
         except (ValueError, psutil.NoSuchProcess, psutil.AccessDenied):
@@ -190,11 +241,10 @@ class ProcessManager:
             return None
 
         try:
-            pid = int(self.pid_file.read_text().strip())
-            process = psutil.Process(pid)
+            process = self._process
 
             return {
-                'pid': pid,
+                'pid': process.pid,
                 'create_time': datetime.fromtimestamp(process.create_time()),
                 'memory_mb': process.memory_info().rss / 1024 / 1024,
                 'status': process.status()
@@ -220,11 +270,18 @@ class ProcessManager:
             print("[+] Status: NOT RUNNING")
 
         log_file = self.base_dir / "VaultSync.log"
-        if log_file.exists():
+
+        # One stat serves the existence check, the size and the mtime
+        try:
+            st = log_file.stat()
+        except FileNotFoundError:
+            st = None
+
+        if st is not None:
 
             print(f"\n[+] Log file: {log_file}")
-            print(f"[+] Log size: {log_file.stat().st_size} bytes")
-            mod_time = datetime.fromtimestamp(log_file.stat().st_mtime)
+            print(f"[+] Log size: {st.st_size} bytes")
+            mod_time = datetime.fromtimestamp(st.st_mtime)
             print(f"[+] Last modified: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
         else:
             print("\n[+] Log file: Not found")
@@ -7,12 +7,10 @@ Coordinates process management, autorun, and configuration validation.
 import sys
 from pathlib import Path
 
-# Use absolute imports since src is added to sys.path
-from sync_core import VaultSync
-from service.process_manager import ProcessManager
-from service.autorun_manager import AutorunManager
-from service.config_validator import ConfigValidator
-from service.config_display import ConfigDisplay
+from .process_manager import ProcessManager
+from .autorun_manager import AutorunManager
+from .config_validator import ConfigValidator
+from .config_display import ConfigDisplay
 
 
 class ServiceHandler:
@@ -53,6 +51,10 @@ class ServiceHandler:
             print("[+] Press Ctrl+C to stop")
             print("-" * 50)
 
+            # The sync engine pulls in git, backup and notification support;
+            # only --run needs it in this process
+            from ..sync_core import VaultSync
+
             app = VaultSync()
             app.run()
 
@@ -101,9 +103,10 @@ class ServiceHandler:
         if sys.platform == "win32":
             print("[+] Autorun Status")
 
-            if self.autorun_manager.is_enabled():
+            info = self.autorun_manager.get_status_info()
+
+            if info['enabled']:
 
-                info = self.autorun_manager.get_status_info()
                 print("[+] Auto-run: ENABLED")
                 print(f"[+] Registry: {info['registry_path']}")
             else:
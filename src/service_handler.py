@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from service.service_handler import ServiceHandler
+from .service.service_handler import ServiceHandler
 
 __all__ = ['ServiceHandler']
 
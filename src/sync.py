@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from sync_core import VaultSync, create_service_instance, main
+from .sync_core import VaultSync, create_service_instance, main
 
 __all__ = ['VaultSync', 'create_service_instance', 'main']
 
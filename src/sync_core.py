@@ -2,17 +2,17 @@
 
 import sys
 import time
-import schedule
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-from config.config_manager import ConfigManager
-from utils.logger import Logger
-from utils.notification_manager import NotificationManager
-from utils.backup_manager import BackupManager
-from git.git_manager import GitManager
-from utils.process_monitor import ProcessMonitor
+from .config.config_manager import ConfigManager
+from .utils.logger import Logger
+from .utils.notification_manager import NotificationManager
+from .utils.backup_manager import BackupManager
+from .git.git_manager import GitManager
+from .utils.process_monitor import ProcessMonitor
 
 
 class VaultSync:
@@ -60,7 +60,13 @@ class VaultSync:
             
             self.logger.info("[+] Obsidian startup detected - pulling latest changes")
             
-            backup_success = self.backup.create_backup()
+            # The fetch only writes .git, which backups skip, so it overlaps
+            # the backup; the merge itself still waits for the backup
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup-fetch") as executor:
+                
+                fetch_future = executor.submit(self.git.prefetch)
+                backup_success = self.backup.create_backup()
+                fetch_future.result()
             
             if not backup_success:
                 self.logger.warning("[!] Backup failed, but continuing with sync")
@@ -194,8 +200,12 @@ class VaultSync:
             self.notification.send_error(f"Unexpected error: {str(e)}")
 
         finally:
+            self.git.close()
+            self.backup.close()
             self.logger.info("[+] VaultSync stopped")
+            self.notification.close()
             self.notification.send_shutdown()
+            self.logger.close()
 
     
     def _run_interval_mode( self ) -> None:
@@ -206,64 +216,64 @@ class VaultSync:
         # Initial startup pull
         self._handle_obsidian_startup()
         
-        schedule.every(self.config.sync.interval_minutes).minutes.do(self._periodic_push)
+        # Next push as a monotonic deadline, so wall-clock jumps cannot
+        # shift or bunch up the schedule
+        push_interval = self.config.sync.interval_minutes * 60
+        next_push = time.monotonic() + push_interval
         
-        last_check = time.time()
         check_interval = 5  
         
         while True:
 
-            current_time = time.time()
+            # Sleep until the next push is due, waking early only when
+            # Obsidian starts (polled every check_interval) or exits
+            timeout = max(next_push - time.monotonic(), 0)
+
+            if self._obsidian_was_running:
+                obsidian_running = not self.process_monitor.wait_for_exit(timeout, check_interval)
+            else:
+                obsidian_running = self.process_monitor.wait_for_start(timeout, check_interval)
             
-            # Only check process status every few seconds to reduce CPU usage
-            if current_time - last_check >= check_interval:
+            # Handle Obsidian restart
+            if obsidian_running and not self._obsidian_was_running:
                 
-                obsidian_running = self.process_monitor.is_running()
-                
-                # Handle Obsidian restart
-                if obsidian_running and not self._obsidian_was_running:
-                    
-                    if self._initial_pull_done:
-                        self.logger.info("[+] Obsidian restarted - pulling updates")
-                        self._handle_obsidian_startup()
-                
-                self._obsidian_was_running = obsidian_running
-                last_check = current_time
+                if self._initial_pull_done:
+                    self.logger.info("[+] Obsidian restarted - pulling updates")
+                    self._handle_obsidian_startup()
+            
+            self._obsidian_was_running = obsidian_running
             
-            schedule.run_pending()
-            time.sleep(1) 
+            if time.monotonic() >= next_push:
+                self._periodic_push()
+                next_push = time.monotonic() + push_interval
     
     
     def _run_on_close_mode( self ) -> None:
        
         self.logger.info("[+] Starting on-close mode - monitoring Obsidian")
 
-        last_check = time.time()
         check_interval = 3  
         
         while True:
             
-            current_time = time.time()
+            # Block until Obsidian changes state: its start is polled every
+            # check_interval, its exit is reported by the process monitor
+            if self._obsidian_was_running:
+                obsidian_running = not self.process_monitor.wait_for_exit(check_interval=check_interval)
+            else:
+                obsidian_running = self.process_monitor.wait_for_start(check_interval=check_interval)
             
-            # Only check process status periodically to reduce CPU usage
-            if current_time - last_check >= check_interval:
-                
-                obsidian_running = self.process_monitor.is_running()
-                
-                # Handle Obsidian startup
-                if obsidian_running and not self._obsidian_was_running:
-                    self._handle_obsidian_startup()
+            # Handle Obsidian startup
+            if obsidian_running and not self._obsidian_was_running:
+                self._handle_obsidian_startup()
+            
+            # Handle Obsidian shutdown
+            elif not obsidian_running and self._obsidian_was_running:
                 
-                # Handle Obsidian shutdown
-                elif not obsidian_running and self._obsidian_was_running:
-                    
-                    self._handle_obsidian_shutdown()
-                    self.logger.info("[+] Continuing to monitor for next Obsidian session...")
-
-                self._obsidian_was_running = obsidian_running
-                last_check = current_time
+                self._handle_obsidian_shutdown()
+                self.logger.info("[+] Continuing to monitor for next Obsidian session...")
 
-            time.sleep(1)  
+            self._obsidian_was_running = obsidian_running
 
 
 def create_service_instance():
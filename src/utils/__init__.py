@@ -2,7 +2,7 @@
 
 from .logger import Logger
 from .error_handler import ErrorHandler, VaultSyncError, retry_on_error, safe_execute
-from .backup_manager import BackupManager
+from .backup_manager import BackupManager, BackupInfo
 from .notification_manager import NotificationManager
 from .process_monitor import ProcessMonitor
 
@@ -14,6 +14,7 @@ __all__ = [
     'retry_on_error',
     'safe_execute',
     'BackupManager',
+    'BackupInfo',
     'NotificationManager',
     'ProcessMonitor'
 ]
\ No newline at end of file
@@ -1,18 +1,99 @@
 #!/usr/bin/env python3
 
 
+import os
+import re
+import sys
+import time
+import errno
+import json
+import heapq
+import hashlib
 import shutil
+import fnmatch
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
-from config.config_manager import BackupConfig
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ..config.config_manager import BackupConfig
 from .logger import Logger
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+_BACKUP_PREFIX = 'vault_backup_'
+
+# Fingerprint of the vault as of the newest backup, kept in the backup directory
+_STATE_FILE = '.last_state.json'
+
+# Backups being deleted are renamed to this prefix first, so a crash mid-way
+# never leaves a partial vault_backup_* behind
+_TRASH_PREFIX = '.trash_'
+
+# ioctl that makes a file share another file's blocks (reflink) on btrfs,
+# XFS and other copy-on-write filesystems
+_FICLONE = 0x40049409 if fcntl is not None and sys.platform.startswith('linux') else None
+
+# FICLONE errors meaning "not possible here" rather than a real failure
+_NO_REFLINK_ERRNOS = frozenset((errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS))
+
+
+@dataclass
+class BackupInfo:
+
+    # One entry of list_backups. The datetime is only built when read;
+    # size_bytes is None when the listing skipped sizes
+    
+    name: str
+    path: Path
+    stamp_ns: int
+    size_bytes: Optional[int] = None
+
+
+    @cached_property
+    def timestamp( self ) -> datetime:
+
+        return datetime.fromtimestamp(self.stamp_ns / 1e9)
+
+
+    @property
+    def size_mb( self ) -> Optional[float]:
+
+        return self.size_bytes / 1024 / 1024 if self.size_bytes is not None else None
+
+
+    def __getitem__( self, key: str ) -> Any:
+
+        # Keeps backup['name'] style access from the old dict entries working
+        return getattr(self, key)
+
+
+def _legacy_stamp_ns( stamp: str ) -> Optional[int]:
+
+    # %Y%m%d_%H%M%S (local time) as used by older versions, in time_ns()
+    # units; None when the digits are not a real date
+
+    try:
+        moment = datetime(int(stamp[:4]), int(stamp[4:6]), int(stamp[6:8]),
+                          int(stamp[9:11]), int(stamp[11:13]), int(stamp[13:15]))
+    except ValueError:
+        return None
+
+    return int(moment.timestamp()) * 1_000_000_000
+
 
 class BackupManager:
 
+    # Concurrent file copies per backup; enough to keep an SSD's queue busy
+    # with small files without flooding the system
+    _copy_workers = 8 if os.name == 'nt' else 16
+
     def __init__( self, config: BackupConfig, vault_path: Path, logger: Logger ):
         
         self.config = config
@@ -25,10 +106,31 @@ class BackupManager:
         self._backup_count = 0
         self._last_backup_time: Optional[float] = None
         self._last_backup_size: Optional[int] = None
+
+        # Last stamp handed out, so two backups never share a name even when
+        # the clock stalls or steps back
+        self._last_stamp_ns = 0
+
+        # Finished backups are never modified, so their size is cached by
+        # path and keyed on the backup root's mtime: path -> (mtime_ns, size)
+        self._size_cache: Dict[str, Tuple[int, int]] = {}
+
+        # Cleared after the first FICLONE that the backup filesystem rejects
+        self._reflink_supported = _FICLONE is not None
+
+        # Ignore patterns compiled once into a single regex
+        self._ignore_re = self._compile_ignore_patterns(self._get_ignore_patterns())
+        
+        # Old backups are unlinked here, off the sync path
+        self._cleanup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup-cleanup")
+        
+        # Runs create_backup_async's backups; its thread starts on first use
+        self._backup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup-async")
         
         if self.config.enabled:
             
             self.config.directory.mkdir(parents=True, exist_ok=True)
+            self._purge_trash()
             self.logger.debug(f"[+] Backup manager initialized - directory: {self.config.directory}")
             
         else:
@@ -63,42 +165,60 @@ class BackupManager:
             # Ensure backup directory exists
             self.config.directory.mkdir(parents=True, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = self.config.directory / f"vault_backup_{timestamp}"
+            # One listing of the vault serves both the change check and the copy
+            dirs, files = self._scan_tree(self.vault_path)
+            fingerprint = self._compute_vault_fingerprint(dirs, files)
+
+            state = self._load_state()
+            last_name = state.get('last_backup_name')
+
+            if state.get('fingerprint') == fingerprint and last_name and (self.config.directory / last_name).is_dir():
+
+                self.logger.info(f"[+] No changes since {last_name} - skipping backup")
+                self._last_backup_time = datetime.now().timestamp()
+                return True
+
+            # Nanosecond stamp, zero-padded so names sort chronologically
+            self._last_stamp_ns = max(time.time_ns(), self._last_stamp_ns + 1)
+            timestamp = f"{self._last_stamp_ns:020d}"
+            backup_path = self.config.directory / f"{_BACKUP_PREFIX}{timestamp}"
             
             self.logger.info(f"[+] Creating backup: {backup_path.name}")
             
-            source_size = self._calculate_directory_size(self.vault_path)
-            self.logger.debug(f"[+] Source size: {source_size / 1024 / 1024:.1f} MB")
-            
-            ignore_patterns = self._get_ignore_patterns()
+            # Unchanged files are hard-linked from the newest existing backup
+            previous_backup = self._latest_backup()
+
+            if previous_backup is not None:
+                self.logger.debug(f"[+] Linking unchanged files from: {previous_backup.name}")
             
-            shutil.copytree(
+            try:
+                file_count, backup_size = self._snapshot_tree(self.vault_path, backup_path, previous_backup, dirs, files)
+                verified = self._verify_backup(backup_path, file_count)
                 
-                self.vault_path,
-                backup_path,
-                ignore=shutil.ignore_patterns(*ignore_patterns),
-                copy_function=shutil.copy2,  # Preserve metadata
-                ignore_dangling_symlinks=True
-            )
-            
-            if not self._verify_backup(backup_path):
+            except BaseException:
                 
-                self.logger.error("[x] Backup verification failed")
+                # A partial tree would become the link source of the next
+                # backup and count toward max_backups
+                shutil.rmtree(backup_path, ignore_errors=True)
+                raise
+            
+            if not verified:
                 
-                if backup_path.exists():
-                    shutil.rmtree(backup_path, ignore_errors=True)
-                    
+                self.logger.error("[x] Backup verification failed")
+                shutil.rmtree(backup_path, ignore_errors=True)
                 return False
             
-            backup_size = self._calculate_directory_size(backup_path)
+            # The copy already tallied the size; seed the cache for list_backups
+            self._size_cache[str(backup_path)] = (os.stat(backup_path).st_mtime_ns, backup_size)
+
             self._last_backup_time = datetime.now().timestamp()
             self._last_backup_size = backup_size
             self._backup_count += 1
             
             self.logger.info(f"[+] Backup created successfully: {backup_path.name}")
-            self.logger.debug(f"[+] Backup size: {backup_size / 1024 / 1024:.1f} MB")
+            self.logger.debug(f"[+] Backup size: {backup_size / 1024 / 1024:.1f} MB ({file_count} files)")
             
+            self._save_state(fingerprint, backup_path.name)
             self._cleanup_old_backups()
             
             return True
@@ -126,17 +246,15 @@ class BackupManager:
 
     def create_backup_async( self ) -> bool:
 
-        # Create backup asynchronously using ThreadPoolExecutor
+        # Create backup on the manager's backup thread, waiting at most
+        # 5 minutes; on timeout the backup carries on in the background
         
         if not self.config.enabled:
             return True
             
         try:
             
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                
-                future = executor.submit(self.create_backup)
-                return future.result(timeout=300)  # 5 minute timeout
+            return self._backup_pool.submit(self.create_backup).result(timeout=300)
                 
         except Exception as e:
             
@@ -179,21 +297,241 @@ class BackupManager:
         ]
 
 
-    def _calculate_directory_size( self, directory: Path ) -> int:
+    def _compile_ignore_patterns( self, patterns: List[str] ) -> "re.Pattern":
+
+        # One regex for all patterns, matched against each entry name. Case
+        # follows the platform, as with shutil.ignore_patterns
+        
+        flags = re.IGNORECASE if os.name == 'nt' else 0
+        return re.compile('|'.join(fnmatch.translate(p) for p in patterns), flags)
+
+
+    def _latest_backup( self ) -> Optional[Path]:
+
+        try:
+            latest = max(self._scan_backups(), default=None)
+        except OSError:
+            return None
+
+        return Path(latest[2]) if latest else None
+
+
+    def _scan_tree( self, source: Path ) -> Tuple[List[str], List[Tuple[str, os.stat_result]]]:
+
+        # Single scandir pass over source, skipping ignored entries. Returns
+        # the relative directories (parents before children) and each file
+        # with its stat result
+
+        dirs  = []
+        files = []
+        pending = [""]
+
+        while pending:
+
+            rel_dir = pending.pop()
+
+            with os.scandir(os.path.join(source, rel_dir)) as entries:
+
+                for entry in entries:
+
+                    # Ignored directories are never entered
+                    if self._ignore_re.match(entry.name):
+                        continue
+
+                    rel_path = os.path.join(rel_dir, entry.name)
+
+                    if entry.is_dir():
+                        dirs.append(rel_path)
+                        pending.append(rel_path)
+                        continue
+
+                    try:
+                        files.append((rel_path, entry.stat()))
+                    except FileNotFoundError:
+                        pass  # Dangling symlink, or removed since the directory was listed
+
+        return dirs, files
+
+
+    @staticmethod
+    def _compute_vault_fingerprint( dirs: List[str], files: List[Tuple[str, os.stat_result]] ) -> str:
+
+        # XOR of a per-entry digest of (path, size, mtime_ns), so it does not
+        # depend on listing order and reads no file contents. blake2b rather
+        # than hash(): str hashes are salted per process and would never match
+        # a fingerprint saved by an earlier run
+
+        acc = 0
+
+        for rel_path in dirs:
+            acc ^= int.from_bytes(hashlib.blake2b(f"{rel_path}/".encode('utf-8', 'surrogateescape'), digest_size=8).digest(), 'little')
+
+        for rel_path, st in files:
+            key = f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}".encode('utf-8', 'surrogateescape')
+            acc ^= int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+        return f"{acc:016x}-{len(dirs)}-{len(files)}"
+
+
+    def _load_state( self ) -> Dict[str, Any]:
+
+        try:
+            with open(self.config.directory / _STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return state if isinstance(state, dict) else {}
+
+
+    def _save_state( self, fingerprint: str, backup_name: str ) -> None:
+
+        # Written to a temp file and renamed over the old one so a crash never
+        # leaves a half-written state behind
+
+        state_path = self.config.directory / _STATE_FILE
+        temp_path  = state_path.with_name(_STATE_FILE + '.tmp')
+
+        try:
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': fingerprint, 'last_backup_name': backup_name}, f)
+
+            os.replace(temp_path, state_path)
+
+        except OSError as e:
+            self.logger.warning(f"[!] Could not save backup state: {e}")
+
+
+    def _snapshot_tree( self, source: Path, target: Path, previous: Optional[Path],
+                        dirs: List[str], files: List[Tuple[str, os.stat_result]] ) -> Tuple[int, int]:
+
+        # Copy the entries listed by _scan_tree into target like
+        # copytree(copy_function=copy2), except that a file whose size and
+        # mtime match its copy in the previous backup is hard-linked to that
+        # copy instead of being copied again. Backups are never modified in
+        # place, so sharing inodes is safe. Directories are created serially;
+        # the per-file work runs on a pool so many small-file reads and writes
+        # are in flight at once. Returns the number of files written and their
+        # total size
+
+        target.mkdir()
+
+        for rel_path in dirs:
+            os.mkdir(os.path.join(target, rel_path))
+
+        if not files:
+            return 0, 0
+
+        file_count = 0
+        total_size = 0
+
+        with ThreadPoolExecutor(max_workers=min(self._copy_workers, len(files)), thread_name_prefix="backup-copy") as executor:
+
+            futures = [
+                executor.submit(
+                    self._snapshot_file,
+                    os.path.join(source, rel_path),
+                    os.path.join(target, rel_path),
+                    os.path.join(previous, rel_path) if previous is not None else None,
+                    st
+                )
+                for rel_path, st in files
+            ]
+
+            for future in as_completed(futures):
+
+                error = future.exception()
+
+                if error is not None:
+
+                    for pending_future in futures:
+                        pending_future.cancel()
+
+                    raise error
+
+                size = future.result()
+
+                if size is not None:
+                    file_count += 1
+                    total_size += size
+
+        return file_count, total_size
+
+
+    def _snapshot_file( self, src_path: str, dst_path: str, old_path: Optional[str], st: os.stat_result ) -> Optional[int]:
+
+        # Size of the file written, or None when it was skipped
+
+        if old_path is not None:
+
+            try:
+
+                old = os.stat(old_path)
+
+                if old.st_size == st.st_size and old.st_mtime_ns == st.st_mtime_ns:
+                    os.link(old_path, dst_path)
+                    return st.st_size
+
+            except OSError:
+                pass  # Not in the previous backup, or no hard links here (EXDEV, FAT)
+
+        try:
+            self._copy_file(src_path, dst_path)
+        except FileNotFoundError:
+            return None  # Removed since the vault was scanned
+
+        return st.st_size
+
+
+    def _copy_file( self, src_path: str, dst_path: str ) -> None:
+
+        # copy2 semantics. A reflink is tried first: the copy then costs
+        # metadata only. Otherwise copy2 runs, which already copies in the
+        # kernel (sendfile on Linux, fcopyfile on macOS)
+
+        if self._reflink_supported:
+
+            try:
+
+                with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+            except OSError as e:
+
+                if e.errno in _NO_REFLINK_ERRNOS:
+                    self._reflink_supported = False
+
+            else:
+
+                shutil.copystat(src_path, dst_path)
+                return
+
+        shutil.copy2(src_path, dst_path)
+
+
+    def _calculate_directory_size( self, directory: Path, cache: bool = False ) -> int:
+
+        # cache=True only for trees that no longer change (finished backups);
+        # a file edit does not touch its directory's mtime, so the live vault
+        # is always walked
                 
         try:
             
-            total_size = 0
-            
-            for file_path in directory.rglob('*'):
-                
-                if file_path.is_file():
-                    
-                    try:
-                        total_size += file_path.stat().st_size
-                    except (OSError, PermissionError):
+            key = str(directory)
 
-                        continue
+            if cache:
+
+                mtime_ns = os.stat(key).st_mtime_ns
+                cached = self._size_cache.get(key)
+
+                if cached is not None and cached[0] == mtime_ns:
+                    return cached[1]
+
+            total_size = self._scan_directory_size(key)
+
+            if cache:
+                self._size_cache[key] = (mtime_ns, total_size)
             
             return total_size
             
@@ -203,15 +541,52 @@ class BackupManager:
             return 0
 
 
-    def _verify_backup( self, backup_path: Path ) -> bool:
+    def _scan_directory_size( self, directory: str ) -> int:
+
+        # os.scandir walk: file types come from the directory listing, so
+        # only regular files cost a stat. Ignored entries are skipped before
+        # any stat and ignored directories (.git, .trash) are never entered
+        
+        total_size = 0
+        pending = [directory]
+
+        while pending:
+
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+
+            with entries:
+
+                for entry in entries:
+
+                    if self._ignore_re.match(entry.name):
+                        continue
+
+                    try:
+
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+
+                    except OSError:
+                        continue
+
+        return total_size
+
+
+    def _verify_backup( self, backup_path: Path, file_count: int ) -> bool:
+
+        # file_count is tallied by _snapshot_tree, so the backup is not walked again
                 
         try:
             
-            if not backup_path.exists() or not backup_path.is_dir():
+            if not backup_path.is_dir():
                 return False
             
-            file_count = sum(1 for _ in backup_path.rglob('*') if _.is_file())
-            
             if file_count == 0:
                 self.logger.warning("[!] Backup appears to be empty")
                 return False
@@ -225,54 +600,126 @@ class BackupManager:
             return False
 
 
+    def _scan_backups( self ) -> List[Tuple[int, str, str]]:
+
+        # (stamp_ns, name, path) for every backup directory. Names carry a
+        # time_ns() stamp, read back with int(); older %Y%m%d_%H%M%S names
+        # are still recognised and converted so both kinds order together
+
+        backups = []
+
+        with os.scandir(self.config.directory) as entries:
+
+            for entry in entries:
+
+                if not entry.name.startswith(_BACKUP_PREFIX) or not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                stamp = entry.name[len(_BACKUP_PREFIX):]
+
+                if len(stamp) == 20 and stamp.isdigit():
+                    stamp_ns = int(stamp)
+
+                elif len(stamp) == 15 and stamp[8] == '_' and stamp[:8].isdigit() and stamp[9:].isdigit():
+                    stamp_ns = _legacy_stamp_ns(stamp)
+
+                else:
+                    stamp_ns = None
+
+                if stamp_ns is None:
+                    self.logger.warning(f"[!] Skipping backup with invalid format: {entry.name}")
+                    continue
+
+                backups.append((stamp_ns, entry.name, entry.path))
+
+        return backups
+
+
     def _cleanup_old_backups( self ) -> None:
         
         # Remove old backups exceeding max_backups 
 
         try:
             
-            # Get all backup directories
-            backups = []
-            
-            for item in self.config.directory.iterdir():
-                
-                if item.is_dir() and item.name.startswith('vault_backup_'):
-                    
-                    try:
-                        
-                        timestamp_str = item.name.replace('vault_backup_', '')
-                        timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                        backups.append((timestamp, item))
-                        
-                    except ValueError:
-                        
-                        self.logger.warning(f"[!] Skipping backup with invalid format: {item.name}")
-                        continue
-            
-            # Sort by timestamp (oldest first)
-            backups.sort(key=lambda x: x[0])
+            backups = self._scan_backups()
+
+            excess = len(backups) - self.config.max_backups
+            if excess <= 0:
+                return
             
-            while len(backups) > self.config.max_backups:
-                
-                oldest_timestamp, oldest_path = backups.pop(0)
+            # Only the oldest few are needed, not a full sort
+            for stamp_ns, name, path in heapq.nsmallest(excess, backups):
                 
                 try:
                     
-                    shutil.rmtree(oldest_path, ignore_errors=True)
-                    self.logger.info(f"[+] Removed old backup: {oldest_path.name}")
+                    self._discard(path)
+                    self._size_cache.pop(path, None)
+                    self.logger.info(f"[+] Removed old backup: {name}")
                     
                 except Exception as e:
                     
-                    self.logger.warning(f"[!] Could not remove old backup {oldest_path.name}: {e}")
+                    self.logger.warning(f"[!] Could not remove old backup {name}: {e}")
                     
         except Exception as e:
             
             self.logger.warning(f"[!] Cleanup error: {e}")
 
 
-    def list_backups( self ) -> List[Dict[str, Any]]:
+    def _discard( self, path: str ) -> None:
+
+        # Rename the backup out of the vault_backup_* namespace, which is
+        # immediate, and leave the slow unlinking of its files to the cleanup
+        # thread. Raises if the rename fails (e.g. a file in use on Windows)
+
+        head, name = os.path.split(path)
+        trash_path = os.path.join(head, _TRASH_PREFIX + name)
+
+        os.rename(path, trash_path)
+        self._cleanup_pool.submit(shutil.rmtree, trash_path, ignore_errors=True)
+
+
+    def _purge_trash( self ) -> None:
+
+        # Finish deletions that an earlier run did not get to
+
+        try:
+
+            with os.scandir(self.config.directory) as entries:
+
+                for entry in entries:
+                    if entry.name.startswith(_TRASH_PREFIX) and entry.is_dir(follow_symlinks=False):
+                        self._cleanup_pool.submit(shutil.rmtree, entry.path, ignore_errors=True)
+
+        except OSError as e:
+            self.logger.debug(f"[!] Could not scan for leftover backups: {e}")
+
+
+    def close( self ) -> None:
+
+        # Queued deletions are waited for so no half-removed backup is left
+        # behind; an async backup still running is not
+        self._backup_pool.shutdown(wait=False)
+        self._cleanup_pool.shutdown(wait=True)
+
+
+    def count_backups( self ) -> int:
+
+        # Number of valid backups: one directory scan, no sizes or dates
+
+        if not self.config.enabled or not self.config.directory.exists():
+            return 0
+
+        try:
+            return len(self._scan_backups())
+        except OSError as e:
+            self.logger.error(f"[x] Error counting backups: {e}")
+            return 0
+
+
+    def list_backups( self, include_size: bool = True ) -> List[BackupInfo]:
         
-        # List available backups with details
+        # List available backups, newest first; include_size=False skips the
+        # per-backup size walk
         
         if not self.config.enabled or not self.config.directory.exists():
             return []
@@ -281,35 +728,19 @@ class BackupManager:
         
         try:
             
-            for item in self.config.directory.iterdir():
+            for stamp_ns, name, path in sorted(self._scan_backups(), reverse=True):
                 
-                if item.is_dir() and item.name.startswith('vault_backup_'):
+                try:
                     
-                    try:
-                        
-                        # Extract timestamp
-                        timestamp_str = item.name.replace('vault_backup_', '')
-                        timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                        
-                        # Get size
-                        size = self._calculate_directory_size(item)
-                        
-                        backups.append({
-                            
-                            'name': item.name,
-                            'path': item,
-                            'timestamp': timestamp,
-                            'size_bytes': size,
-                            'size_mb': size / 1024 / 1024
-                        })
-                        
-                    except (ValueError, OSError) as e:
-                        
-                        self.logger.warning(f"[!] Error processing backup {item.name}: {e}")
-                        continue
-            
-            # Sort by timestamp (newest first)
-            backups.sort(key=lambda x: x['timestamp'], reverse=True)
+                    item = Path(path)
+                    size = self._calculate_directory_size(item, cache=True) if include_size else None
+                    
+                    backups.append(BackupInfo(name, item, stamp_ns, size))
+                    
+                except OSError as e:
+                    
+                    self.logger.warning(f"[!] Error processing backup {name}: {e}")
+                    continue
             
         except Exception as e:
             
@@ -365,7 +796,8 @@ class BackupManager:
         
         try:
             
-            shutil.rmtree(backup_path)
+            self._discard(str(backup_path))
+            self._size_cache.pop(str(backup_path), None)
             self.logger.info(f"[+] Backup deleted: {backup_name}")
             return True
             
@@ -387,5 +819,5 @@ class BackupManager:
             'last_backup_time': self._last_backup_time,
             'last_backup_size': self._last_backup_size,
             'backup_in_progress': self._backup_in_progress,
-            'available_backups': len(self.list_backups())
+            'available_backups': self.count_backups()
         }
\ No newline at end of file
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
 import sys
+import time
+import logging
 import traceback
 from typing import Optional, Callable, Any
-from functools import wraps
+from functools import wraps, lru_cache
 from .logger import Logger
 
 
@@ -51,17 +53,35 @@ class ErrorHandler:
         if fatal:
             
             self.logger.critical(error_msg)
-            self.logger.critical(f"[x] Stack trace: {traceback.format_exc()}")
+            self.logger.critical(f"[x] Stack trace: {_format_traceback(error)}")
             
         else:
             
             self.logger.error(error_msg)
-            self.logger.debug(f"[!] Stack trace: {traceback.format_exc()}")
+            
+            # Formatting a traceback is costly; only do it when it gets logged
+            if self.logger.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"[!] Stack trace: {_format_traceback(error)}")
         
         return not fatal
 
 
-def retry_on_error( max_retries: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,) ):
+def _format_traceback( error: Exception ) -> str:
+    
+    # Formats the error's own traceback, so it is right even outside the
+    # except block that caught it
+    return "".join(traceback.TracebackException.from_exception(error).format())
+
+
+@lru_cache(maxsize=8)
+def _shared_handler( logger: Logger ) -> ErrorHandler:
+    
+    # One ErrorHandler per logger for safe_execute; loggers live for the
+    # whole process, so the small cache never churns
+    return ErrorHandler(logger)
+
+
+def retry_on_error( max_retries: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,), backoff: float = 1.0 ):
     
     
     def decorator( func: Callable ) -> Callable:
@@ -69,38 +89,34 @@ def retry_on_error( max_retries: int = 3, delay: float = 1.0, exceptions: tuple
         @wraps(func)
         def wrapper( *args, **kwargs ) -> Any:
             
-            last_exception = None
+            # First attempt outside the loop: a call that succeeds costs
+            # nothing beyond the call itself
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
+            
+            # Only a failure pays for finding a logger (self.logger on methods)
+            logger = next((arg.logger for arg in args if hasattr(arg, 'logger')), None)
             
-            for attempt in range(max_retries + 1):
+            for attempt in range(max_retries):
+                
+                # Constant delay by default; backoff > 1 grows it per attempt:
+                # delay, delay*backoff, delay*backoff**2, ...
+                wait = delay * backoff ** attempt
+                
+                if logger:
+                    logger.warning(f"[!] Attempt {attempt + 1} failed, retrying in {wait}s: {last_exception}")
+                
+                time.sleep(wait)
                 
                 try:
-                    
                     return func(*args, **kwargs)
-                    
                 except exceptions as e:
-                    
                     last_exception = e
-                    
-                    if attempt < max_retries:
-                        
-                        logger = None
-                        for arg in args:
-                            if hasattr(arg, 'logger'):
-                                logger = arg.logger
-                                break
-                        
-                        if logger:
-                            logger.warning(f"[!] Attempt {attempt + 1} failed, retrying in {delay}s: {e}")
-                        
-                        import time
-                        time.sleep(delay)
-                        
-                    else:
-                        
-                        if logger:
-                            logger.error(f"[x] All {max_retries + 1} attempts failed")
-                        
-                        raise last_exception
+            
+            if logger:
+                logger.error(f"[x] All {max_retries + 1} attempts failed")
             
             raise last_exception
             
@@ -109,7 +125,8 @@ def retry_on_error( max_retries: int = 3, delay: float = 1.0, exceptions: tuple
     return decorator
 
 
-def safe_execute( func: Callable, logger: Logger, context: str = "", default_return: Any = None ) -> Any:
+def safe_execute( func: Callable, logger: Logger, context: str = "", default_return: Any = None,
+                  error_handler: Optional[ErrorHandler] = None ) -> Any:
         
     try:
         
@@ -117,7 +134,6 @@ def safe_execute( func: Callable, logger: Logger, context: str = "", default_ret
         
     except Exception as e:
         
-        error_handler = ErrorHandler(logger)
-        error_handler.handle_error(e, context)
+        (error_handler or _shared_handler(logger)).handle_error(e, context)
         
         return default_return
\ No newline at end of file
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import queue
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
@@ -24,12 +26,14 @@ class Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
+        handlers = []
+
         if not service_mode:
             
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
             console_handler.setLevel(logging.INFO)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         file_handler = logging.handlers.RotatingFileHandler(
             
@@ -40,9 +44,38 @@ class Logger:
         )
         
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+        # Callers only enqueue the record; a listener thread does the
+        # formatting and the console/file writes
+        log_queue = queue.SimpleQueue()
+
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+
+        self.logger.addHandler(self._queue_handler)
         
         self.logger.propagate = False
+
+        atexit.register(self.close)
+
+
+    def close( self ) -> None:
+
+        # Flush queued records and stop the listener thread. Later messages
+        # are written directly by the underlying handlers
+
+        if self._listener is None:
+            return
+
+        listener, self._listener = self._listener, None
+        listener.stop()
+
+        self.logger.removeHandler(self._queue_handler)
+
+        for handler in listener.handlers:
+            self.logger.addHandler(handler)
     
     
     def debug( self, message: str ) -> None:
@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 
 import time
-from typing import Optional, Dict, Any
+import heapq
+import hashlib
+import threading
+import traceback
+from functools import partial
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
-from config.config_manager import NotificationConfig
+from ..config.config_manager import NotificationConfig
 from .logger import Logger
 
+# History entries tolerated before expired ones are swept out
+_HISTORY_SWEEP_THRESHOLD = 32
+
+# Longest message of a coalesced notification; toast/balloon text is short
+_SUMMARY_MAX_CHARS = 240
+
 try:
     from plyer import notification
     PLYER_AVAILABLE = True
@@ -21,12 +32,41 @@ class NotificationManager:
         self.config = config
         self.logger = logger
         
+        # notify() with the arguments that never change already bound, icon
+        # existence included, so a send does not stat the icon file every time
+        self._notifier = None
+        
+        if PLYER_AVAILABLE:
+            
+            fixed_kwargs = {'app_name': "VaultSync", 'timeout': config.timeout}
+            
+            if config.icon_path and config.icon_path.exists():
+                fixed_kwargs['app_icon'] = str(config.icon_path)
+            
+            self._notifier = partial(notification.notify, **fixed_kwargs)
+        
+        # Timestamps are time.monotonic_ns(): integer compares, and immune to
+        # wall-clock changes
         self._last_notification_time = 0
         self._min_notification_interval = 5 
+        self._min_notification_interval_ns = self._min_notification_interval * 1_000_000_000
         self._notification_count = 0
         
-        self._recent_notifications: Dict[str, float] = {}
+        # 8-byte digest of (title, message) -> sent time; long error messages
+        # are not kept alive just for duplicate detection
+        self._recent_notifications: Dict[bytes, int] = {}
         self._duplicate_timeout = 30
+        self._duplicate_timeout_ns = self._duplicate_timeout * 1_000_000_000
+        
+        # (sent_time, key) min-heap, so expiry only looks at the oldest entries
+        self._expiry_heap: List[Tuple[int, bytes]] = []
+        
+        # Notifications held back by the rate limit: (message, key). Only
+        # successes are ever held back. A timer delivers them as one
+        # notification when the interval ends
+        self._pending: List[Tuple[str, bytes]] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
 
         if not PLYER_AVAILABLE:
             self.logger.warning("[!] Plyer not available - notifications disabled")
@@ -51,51 +91,171 @@ class NotificationManager:
         
         try:
 
-            title = "🔄 VaultSync" if success else "❌ VaultSync Error"
             msg = message or ("Sync completed successfully!" if success else "Sync failed - check logs")
             
-            current_time = time.time()
+            # The title only depends on success, which picks the personalisation
+            notification_key = hashlib.blake2b(
+                msg.encode('utf-8', 'surrogatepass'), digest_size=8, person=b'ok' if success else b'error'
+            ).digest()
             
-            if not force and current_time - self._last_notification_time < self._min_notification_interval:
-                self.logger.debug(f"[*] Notification rate limited ({self._min_notification_interval}s interval)")
-                return False
+            # Failures are high-impact: like force, they skip both the
+            # duplicate window and the rate limit, without callers asking.
+            # Decided by success alone, not the text: a success message such
+            # as "0 errors" stays coalesced
+            suppressible = not (force or not success)
             
-            notification_key = f"{title}:{msg}"
-            
-            if not force and notification_key in self._recent_notifications:
-
-                time_since_last = current_time - self._recent_notifications[notification_key]
-                if time_since_last < self._duplicate_timeout:
-                    self.logger.debug(f"[*] Duplicate notification suppressed (sent {time_since_last:.1f}s ago)")
+            with self._lock:
+                
+                current_time = time.monotonic_ns()
+                
+                last_sent = self._recent_notifications.get(notification_key) if suppressible else None
+                
+                if last_sent is not None:
+
+                    time_since_last = current_time - last_sent
+                    if time_since_last < self._duplicate_timeout_ns:
+                        self.logger.debug(f"[*] Duplicate notification suppressed (sent {time_since_last / 1e9:.1f}s ago)")
+                        return False
+                
+                if suppressible and current_time - self._last_notification_time < self._min_notification_interval_ns:
+                    
+                    if all(key != notification_key for _, key in self._pending):
+                        self._pending.append((msg, notification_key))
+                    
+                    if self._flush_timer is None:
+                        
+                        delay = (self._last_notification_time + self._min_notification_interval_ns - current_time) / 1e9
+                        self._flush_timer = threading.Timer(delay, self._flush_pending)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+                    
+                    self.logger.debug(f"[*] Notification rate limited ({self._min_notification_interval}s interval), "
+                                      f"{len(self._pending)} pending")
                     return False
+                
+                undo = self._record_sent([notification_key], current_time)
             
-            notification_kwargs = {
-                'title': title,
-                'message': msg,
-                'app_name': "VaultSync",
-                'timeout': self.config.timeout
-            }
+            try:
+                self._notify(success, msg)
+            except Exception:
+                self._undo_sent(undo)
+                raise
+            
+            return True
 
-            if self.config.icon_path and self.config.icon_path.exists():
-                notification_kwargs['app_icon'] = str(self.config.icon_path)
+        except Exception as e:
+            self.logger.error(f"[x] Notification error: {e}")
+            self.logger.debug(traceback.format_exc())
+            return False
 
-            # Send the notification
-            self.logger.info(f"[+] Notification: {msg}")
-            notification.notify(**notification_kwargs)
 
-            self._last_notification_time = current_time
-            self._recent_notifications[notification_key] = current_time
-            self._notification_count += 1
+    def _record_sent( self, keys: List[bytes], current_time: int ) -> tuple:
+        
+        # Called with _lock held. Returns what _undo_sent needs to take the
+        # record back if the notification then fails
+        
+        undo = (current_time, self._last_notification_time,
+                [(key, self._recent_notifications.get(key)) for key in keys])
+        
+        self._last_notification_time = current_time
+        
+        for key in keys:
+            self._recent_notifications[key] = current_time
+            heapq.heappush(self._expiry_heap, (current_time, key))
+        
+        self._notification_count += 1
 
+        # Expired entries never suppress anything (the duplicate check
+        # covers that), so they are only swept in batches
+        if len(self._expiry_heap) > _HISTORY_SWEEP_THRESHOLD:
             self._cleanup_notification_history(current_time)
+        
+        return undo
 
-            return True
 
+    def _undo_sent( self, undo: tuple ) -> None:
+        
+        # A failed notification must not suppress its retry or rate limit the
+        # next one. Anything recorded by a later send is left alone, and the
+        # stale heap entries are skipped by the history cleanup
+        
+        current_time, last_time, previous = undo
+        
+        with self._lock:
+            
+            if self._last_notification_time == current_time:
+                self._last_notification_time = last_time
+            
+            for key, last_sent in previous:
+                
+                if self._recent_notifications.get(key) != current_time:
+                    continue
+                
+                if last_sent is None:
+                    del self._recent_notifications[key]
+                else:
+                    self._recent_notifications[key] = last_sent
+            
+            self._notification_count -= 1
+
+
+    def _notify( self, success: bool, msg: str ) -> None:
+        
+        # The OS call happens outside _lock, it can take a while
+        
+        # Send the notification
+        self.logger.info(f"[+] Notification: {msg}")
+        self._notifier(title="🔄 VaultSync" if success else "❌ VaultSync Error", message=msg)
+
+
+    def _flush_pending( self ) -> None:
+        
+        # Deliver everything held back by the rate limit as one notification
+        
+        try:
+            
+            with self._lock:
+                
+                pending, self._pending = self._pending, []
+                self._flush_timer = None
+                
+                if not pending:
+                    return
+                
+                undo = self._record_sent([key for _, key in pending], time.monotonic_ns())
+            
+            if len(pending) == 1:
+                msg = pending[0][0]
+                
+            else:
+                
+                msg = f"{len(pending)} events: " + "; ".join(text for text, _ in pending)
+                
+                if len(msg) > _SUMMARY_MAX_CHARS:
+                    msg = msg[:_SUMMARY_MAX_CHARS - 3] + "..."
+            
+            try:
+                self._notify(True, msg)
+            except Exception:
+                self._undo_sent(undo)
+                raise
+            
         except Exception as e:
             self.logger.error(f"[x] Notification error: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
-            return False
+
+
+    def close( self ) -> None:
+        
+        # Deliver held-back notifications now instead of dropping them on exit
+        
+        with self._lock:
+            
+            timer, self._flush_timer = self._flush_timer, None
+            
+            if timer is not None:
+                timer.cancel()
+        
+        self._flush_pending()
 
 
     def send_startup( self ) -> bool:
@@ -129,8 +289,7 @@ class NotificationManager:
         return self.send(
             
             success=False, 
-            message=f"Error: {error_message}",
-            force=True
+            message=f"Error: {error_message}"
         )
 
 
@@ -146,23 +305,28 @@ class NotificationManager:
         return self.send(success=True, message=message)
 
 
-    def _cleanup_notification_history( self, current_time: float ) -> None: 
+    def _cleanup_notification_history( self, current_time: int ) -> None: 
         
-        cutoff_time = current_time - self._duplicate_timeout
+        cutoff_time = current_time - self._duplicate_timeout_ns
         
-        # Remove old entries
-        keys_to_remove = [
-            
-            key for key, timestamp in self._recent_notifications.items() 
-            if timestamp < cutoff_time
-        ]
+        # Pop expired entries oldest first and stop at the first live one. A
+        # key sent again has a newer heap entry too, so an old one only
+        # removes the key while its timestamp is still the current one
+        heap = self._expiry_heap
         
-        for key in keys_to_remove:
-            del self._recent_notifications[key]
+        while heap and heap[0][0] < cutoff_time:
+            
+            timestamp, key = heapq.heappop(heap)
+            
+            if self._recent_notifications.get(key) == timestamp:
+                del self._recent_notifications[key]
 
 
     def get_stats( self ) -> Dict[str, Any]:
         
+        # Sweep first so recent_count only covers unexpired notifications
+        with self._lock:
+            self._cleanup_notification_history(time.monotonic_ns())
         
         return {
             
@@ -170,6 +334,7 @@ class NotificationManager:
             'plyer_available': PLYER_AVAILABLE,
             'total_sent': self._notification_count,
             'recent_count': len(self._recent_notifications),
+            'pending_count': len(self._pending),
             'timeout': self.config.timeout,
             'min_interval': self._min_notification_interval
         }
\ No newline at end of file
@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
 
+import os
+import sys
+import math
 import time
+import select
 import psutil
-from typing import Set, Optional
+from typing import Set, Optional, Iterator, Tuple
 from .logger import Logger
 
 
+# The kernel keeps at most this many bytes of a name in /proc/<pid>/comm
+_COMM_LEN = 15
+
+# Polling waits start this fast and back off by _POLL_BACKOFF per round up to
+# the caller's check_interval, so a change that happens right away is seen
+# within a few tens of milliseconds
+_POLL_START = 0.05
+_POLL_BACKOFF = 1.5
+
+
 class ProcessMonitor:
 
         
@@ -14,13 +28,27 @@ class ProcessMonitor:
         self.process_name = process_name
         self.logger = logger
         
-        # Process caching for performance
-        self._cached_pids: Set[int] = set()
+        # Process caching for performance. Times are time.monotonic_ns(); the
+        # PIDs last seen alive are a tuple since there is nearly always one
+        self._cached_pids: Tuple[int, ...] = ()
         self._last_full_scan = 0
         self._full_scan_interval = 30  
+        self._full_scan_interval_ns = self._full_scan_interval * 1_000_000_000
         self._last_check_result = False
         self._last_check_time = 0
         self._check_cache_duration = 2  
+        self._check_cache_duration_ns = self._check_cache_duration * 1_000_000_000
+        
+        # Linux: process name as /proc/<pid>/comm shows it, and whether that
+        # is cut short so a comm match still needs confirming
+        self._is_linux = sys.platform.startswith('linux')
+        self._comm_name = process_name.encode()[:_COMM_LEN]
+        self._comm_truncated = len(process_name.encode()) > _COMM_LEN
+
+        # Exit notification backend: pidfd on Linux, kqueue on macOS/BSD;
+        # cleared when the kernel turns out not to support it
+        self._pidfd_supported = hasattr(os, 'pidfd_open')
+        self._kqueue_supported = hasattr(select, 'kqueue') and hasattr(select, 'KQ_FILTER_PROC')
         
         self.logger.debug(f"[+] Process monitor initialized for: {process_name}")
     
@@ -28,10 +56,10 @@ class ProcessMonitor:
     def is_running( self ) -> bool:
 
         
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         
         # Use cached result if recent enough
-        if current_time - self._last_check_time < self._check_cache_duration:
+        if current_time - self._last_check_time < self._check_cache_duration_ns:
             return self._last_check_result
         
         try:
@@ -49,23 +77,23 @@ class ProcessMonitor:
                     return True
                 
                 # Clear cache if no processes found
-                self._cached_pids.clear()
+                self._cached_pids = ()
             
             # Perform full scan if cache is empty or enough time has passed
             should_full_scan = (
                 
                 not self._cached_pids or 
-                current_time - self._last_full_scan > self._full_scan_interval
+                current_time - self._last_full_scan > self._full_scan_interval_ns
             )
             
             if should_full_scan:
                 
-                found_pids = self._full_process_scan()
+                pid = self._any_running()
                 self._last_full_scan = current_time
                 
-                if found_pids:
+                if pid is not None:
                     
-                    self._cached_pids = found_pids
+                    self._cached_pids = (pid,)
                     self._last_check_result = True
                     self._last_check_time = current_time
                     return True
@@ -84,28 +112,125 @@ class ProcessMonitor:
             return False
 
 
-    def _validate_cached_pids( self ) -> Set[int]:
+    def _validate_cached_pids( self ) -> Tuple[int, ...]:
         
         
-        alive_pids = set()
+        alive_pids = []
         
-        for pid in self._cached_pids.copy():
+        for pid in self._cached_pids:
+
+            if self._is_linux:
+
+                # One short read, and unlike signal 0 it also catches a PID
+                # that was reused by some other program
+                if self._comm_matches(pid):
+                    alive_pids.append(pid)
+
+                continue
+
+            if os.name == 'posix':
+
+                # Signal 0 only checks that the PID exists: ESRCH means it is
+                # gone, EPERM that it lives under another user. The name was
+                # matched when the PID was found, so one syscall suffices
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    continue
+                except PermissionError:
+                    pass
+
+                alive_pids.append(pid)
+                continue
             
             try:
                 
-                if psutil.pid_exists(pid):
-                    
-                    proc = psutil.Process(pid)
-                
-                    if proc.name() == self.process_name:
-                        alive_pids.add(pid)
+                # Process() already fails for a missing PID, so a separate
+                # pid_exists() probe would only repeat the lookup
+                if psutil.Process(pid).name() == self.process_name:
+                    alive_pids.append(pid)
                         
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 
                 # Process no longer exists or accessible
                 pass
         
-        return alive_pids
+        return tuple(alive_pids)
+
+
+    def _any_running( self ) -> Optional[int]:
+        
+        # PID of the first matching process, None if there is none. Stops at
+        # the first match, so a typical scan touches a fraction of the
+        # process table. A cached PID that later exits just triggers another
+        # scan, which finds any sibling process
+        
+        try:
+            
+            for pid in self._iter_matching_pids():
+                
+                self.logger.debug(f"[+] Found {self.process_name} process: PID {pid}")
+                return pid
+                    
+        except Exception as e:
+            
+            self.logger.warning(f"[!] Error during process scan: {e}")
+            
+        return None
+
+
+    def _iter_matching_pids( self ) -> Iterator[int]:
+        
+        # PIDs whose process name matches, lazily. On Linux this is a scandir
+        # of /proc plus one comm read per process; psutil elsewhere
+        
+        # The name and matcher are fixed for the monitor's lifetime; held in
+        # locals so the per-process loop does no attribute lookups on self
+        
+        if self._is_linux:
+            
+            comm_matches = self._comm_matches
+            
+            with os.scandir('/proc') as entries:
+                
+                for entry in entries:
+                    
+                    if entry.name.isdigit() and comm_matches(int(entry.name)):
+                        yield int(entry.name)
+            
+            return
+        
+        process_name = self.process_name
+        
+        for proc in psutil.process_iter():
+            
+            try:
+                
+                if proc.name() == process_name:
+                    yield proc.pid
+                    
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                
+                continue
+
+
+    def _comm_matches( self, pid: int ) -> bool:
+        
+        try:
+            with open(f"/proc/{pid}/comm", 'rb') as f:
+                if f.read().rstrip(b'\n') != self._comm_name:
+                    return False
+        except OSError:
+            return False
+        
+        if not self._comm_truncated:
+            return True
+        
+        # psutil rebuilds a full-length name from the command line
+        try:
+            return psutil.Process(pid).name() == self.process_name
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
 
 
     def _full_process_scan( self ) -> Set[int]:
@@ -116,20 +241,10 @@ class ProcessMonitor:
         
         try:
             
-            for proc in psutil.process_iter(['pid', 'name'], ad_value=None):
+            for pid in self._iter_matching_pids():
                 
-                try:
-                    
-                    proc_info = proc.info
-                    
-                    if proc_info['name'] == self.process_name:
-                        
-                        found_pids.add(proc_info['pid'])
-                        self.logger.debug(f"[+] Found {self.process_name} process: PID {proc_info['pid']}")
-                        
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    
-                    continue
+                found_pids.add(pid)
+                self.logger.debug(f"[+] Found {self.process_name} process: PID {pid}")
                     
         except Exception as e:
             
@@ -148,7 +263,7 @@ class ProcessMonitor:
             
             if self._cached_pids:
                 
-                pid = next(iter(self._cached_pids))
+                pid = self._cached_pids[0]
                 proc = psutil.Process(pid)
                 
                 return {
@@ -168,21 +283,163 @@ class ProcessMonitor:
         return None
 
 
+    def wait_for_start( self, timeout: Optional[float] = None, check_interval: float = 1.0 ) -> bool:
+
+
+        # Poll until the process appears (True) or timeout runs out (False),
+        # backing off to every check_interval seconds. There is nothing to
+        # wait on before the process exists, so this stays a poll
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = min(_POLL_START, check_interval)
+
+        while True:
+
+            self._last_check_time = 0
+
+            if self.is_running():
+                return True
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            time.sleep(interval if remaining is None else min(interval, remaining))
+            interval = min(interval * _POLL_BACKOFF, check_interval)
+
+
+    def wait_for_exit( self, timeout: Optional[float] = None, check_interval: float = 1.0 ) -> bool:
+
+
+        # Block until every matching process has exited (True) or timeout runs
+        # out (False). The kernel wakes us when a watched PID exits; without
+        # an exit notification backend this falls back to a poll that backs
+        # off to check_interval like wait_for_start
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = min(_POLL_START, check_interval)
+
+        while True:
+
+            self._last_check_time = 0
+
+            if not self.is_running():
+                return True
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            self._wait_pids(self._cached_pids, remaining, interval)
+            interval = min(interval * _POLL_BACKOFF, check_interval)
+
+
+    def _wait_pids( self, pids: Tuple[int, ...], timeout: Optional[float], check_interval: float ) -> None:
+
+
+        # Return once any of pids exits, timeout elapses or, on the fallback
+        # path, check_interval elapses; the caller re-checks afterwards
+
+        if self._pidfd_supported:
+
+            try:
+                self._wait_pidfd(pids, timeout)
+                return
+
+            except OSError as e:
+
+                if isinstance(e, ProcessLookupError):
+                    return
+
+                self.logger.debug(f"[*] pidfd unavailable, polling instead: {e}")
+                self._pidfd_supported = False
+
+        if self._kqueue_supported:
+
+            try:
+                self._wait_kqueue(pids, timeout)
+                return
+
+            except OSError as e:
+
+                if isinstance(e, ProcessLookupError):
+                    return
+
+                self.logger.debug(f"[*] kqueue unavailable, polling instead: {e}")
+                self._kqueue_supported = False
+
+        if sys.platform == "win32":
+
+            # WaitForSingleObject under the hood. Sliced to check_interval so
+            # that Ctrl+C is still handled between waits
+            wait = check_interval if timeout is None else min(check_interval, timeout)
+
+            try:
+                psutil.Process(min(pids)).wait(wait)
+            except (psutil.TimeoutExpired, psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+            return
+
+        time.sleep(check_interval if timeout is None else min(check_interval, timeout))
+
+
+    def _wait_pidfd( self, pids: Tuple[int, ...], timeout: Optional[float] ) -> None:
+
+
+        fds = []
+
+        try:
+
+            poller = select.poll()
+
+            for pid in pids:
+                fd = os.pidfd_open(pid)
+                fds.append(fd)
+                poller.register(fd, select.POLLIN)
+
+            poller.poll(None if timeout is None else math.ceil(timeout * 1000))
+
+        finally:
+
+            for fd in fds:
+                os.close(fd)
+
+
+    def _wait_kqueue( self, pids: Tuple[int, ...], timeout: Optional[float] ) -> None:
+
+
+        kq = select.kqueue()
+
+        try:
+
+            events = [
+
+                select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT
+                )
+                for pid in pids
+            ]
+
+            kq.control(events, 0)
+            kq.control(None, len(events), timeout)
+
+        finally:
+            kq.close()
+
+
     def wait_for_process_start( self, timeout: int = 60, check_interval: float = 1.0 ) -> bool:
         
         
         self.logger.info(f"[+] Waiting for {self.process_name} to start (timeout: {timeout}s)")
         
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        if self.wait_for_start(timeout, check_interval):
             
-            if self.is_running():
-                
-                self.logger.info(f"[+] {self.process_name} started")
-                return True
-                
-            time.sleep(check_interval)
+            self.logger.info(f"[+] {self.process_name} started")
+            return True
         
         self.logger.warning(f"[!] Timeout waiting for {self.process_name} to start")
         return False
@@ -193,16 +450,10 @@ class ProcessMonitor:
         
         self.logger.info(f"[+] Waiting for {self.process_name} to stop (timeout: {timeout}s)")
         
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        if self.wait_for_exit(timeout, check_interval):
             
-            if not self.is_running():
-                
-                self.logger.info(f"[+] {self.process_name} stopped")
-                return True
-                
-            time.sleep(check_interval)
+            self.logger.info(f"[+] {self.process_name} stopped")
+            return True
         
         self.logger.warning(f"[!] Timeout waiting for {self.process_name} to stop")
         return False
@@ -210,7 +461,7 @@ class ProcessMonitor:
 
     def clear_cache( self ) -> None:
                 
-        self._cached_pids.clear()
+        self._cached_pids = ()
         self._last_full_scan = 0
         self._last_check_time = 0
         self.logger.debug("[+] Process monitor cache cleared")
\ No newline at end of file
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+.env parsing and saving, checked against python-dotenv where it is installed.
+Run from the VaultSync directory: python -m unittest discover tests
+"""
+
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.config.config_manager import ConfigSetup, _parse_env_file
+
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    dotenv_values = None
+
+
+# Each form python-dotenv accepted, with the value it produced
+_FORMS = {
+
+    'plain':            ('GITHUB_TOKEN=ghp_abc123', 'ghp_abc123'),
+    'export':           ('export GITHUB_TOKEN=ghp_abc123', 'ghp_abc123'),
+    'spaces':           ('  GITHUB_TOKEN =  ghp_abc123  ', 'ghp_abc123'),
+    'inline comment':   ('GITHUB_TOKEN=ghp_abc123 # personal token', 'ghp_abc123'),
+    'hash in value':    ('GITHUB_TOKEN=ghp_abc#123', 'ghp_abc#123'),
+    'empty':            ('GITHUB_TOKEN=', ''),
+    'single quoted':    ("GITHUB_TOKEN='a b # c'", 'a b # c'),
+    'single escapes':   ("GITHUB_TOKEN='it\\'s \\\\ here'", "it's \\ here"),
+    'double quoted':    ('GITHUB_TOKEN="a b # c" # comment', 'a b # c'),
+    'double escapes':   ('GITHUB_TOKEN="say \\"hi\\"\\n\\\\ \\t"', 'say "hi"\n\\ \t'),
+    'backslash bare':   ('GITHUB_TOKEN=C:\\path\\to', 'C:\\path\\to'),
+}
+
+
+class EnvParseTest(unittest.TestCase):
+
+    def setUp( self ):
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.env_file = Path(tmp.name) / ".env"
+
+    def _parse( self, text: str ) -> dict:
+
+        self.env_file.write_text(text, encoding='utf-8')
+        return _parse_env_file(self.env_file)
+
+    def test_forms( self ):
+
+        for name, (line, expected) in _FORMS.items():
+            with self.subTest(name):
+                self.assertEqual(self._parse(line + "\n"), {'GITHUB_TOKEN': expected})
+
+    @unittest.skipIf(dotenv_values is None, "python-dotenv not installed")
+    def test_forms_match_dotenv( self ):
+
+        for name, (line, _) in _FORMS.items():
+            with self.subTest(name):
+                self.assertEqual(self._parse(line + "\n"), dict(dotenv_values(stream=io.StringIO(line + "\n"))))
+
+    def test_comments_and_invalid_lines_skipped( self ):
+
+        with self.assertLogs("VaultSync", level='WARNING') as logs:
+            env = self._parse("# header\n\nnot a setting\nGITHUB_USERNAME=me\n")
+
+        self.assertEqual(env, {'GITHUB_USERNAME': 'me'})
+        self.assertIn("line 3", logs.output[0])
+
+
+class EnvSaveTest(unittest.TestCase):
+
+    def setUp( self ):
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        self.setup = ConfigSetup()
+        self.setup.env_file = Path(tmp.name) / ".env"
+
+    def test_keeps_unreadable_lines_and_comments( self ):
+
+        original = ("# mine\n"
+                    "export GITHUB_TOKEN=old # rotate monthly\n"
+                    "some line the parser cannot read\n"
+                    "GITHUB_USERNAME=me # comment kept\n")
+
+        self.setup.env_file.write_text(original, encoding='utf-8')
+
+        self.setup._save_env({'GITHUB_TOKEN': 'new', 'GITHUB_USERNAME': 'me', 'GITHUB_REPOSITORY': 'notes'})
+
+        self.assertEqual(self.setup.env_file.read_text(encoding='utf-8'),
+                         "# mine\n"
+                         "export GITHUB_TOKEN=new\n"
+                         "some line the parser cannot read\n"
+                         "GITHUB_USERNAME=me # comment kept\n"
+                         "GITHUB_REPOSITORY=notes\n")
+
+    def test_values_read_back_unchanged( self ):
+
+        values = {'A': 'plain', 'B': 'a b # c', 'C': 'it\'s "quoted"', 'D': 'back\\slash "x"', 'E': 'two\nlines', 'F': ''}
+
+        self.setup._save_env(values)
+
+        self.assertEqual(_parse_env_file(self.setup.env_file), values)
+
+        if dotenv_values is not None:
+            self.assertEqual(dict(dotenv_values(self.setup.env_file)), values)
+
+
+if __name__ == '__main__':
+    unittest.main()